@@ -10,18 +10,21 @@ from typing import Optional
 
 from .models import Chunk
 
+MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
 TOKEN_RE = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ0-9']+")
-FR_STOP = {
+FR_STOP = frozenset({
     "le","la","les","un","une","des","de","du","d","et","en","à","a","au","aux","pour","par",
     "sur","dans","avec","sans","ce","cet","cette","ces","il","elle","ils","elles","on",
     "que","qui","quoi","dont","où","se","sa","son","ses","leur","leurs","plus","moins",
     "est","sont","été","être","avoir","avait","ont","a","y","ne","pas","comme"
-}
+})
 
 
 def normalize_text(text: str) -> str:
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # Sans \r (cas courant) on évite les deux passes de replace
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = MULTI_NEWLINE_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -47,10 +50,11 @@ def chunk_text(text: str, chunk_size: int = 1200, overlap: int = 200) -> list[st
 
 
 def tokenize(text: str, remove_stop: bool = True) -> list[str]:
-    tokens = [m.group(0).lower() for m in TOKEN_RE.finditer(text)]
+    # findall évite un objet Match par token; minuscules après découpe (et non sur le
+    # texte entier) pour garder exactement les mêmes frontières de tokens.
     if remove_stop:
-        tokens = [t for t in tokens if t not in FR_STOP and len(t) > 1]
-    return tokens
+        return [t for tok in TOKEN_RE.findall(text) if len(t := tok.lower()) > 1 and t not in FR_STOP]
+    return [tok.lower() for tok in TOKEN_RE.findall(text)]
 
 
 class BM25Index:
@@ -86,7 +90,9 @@ class BM25Index:
         return math.log(1 + (n - df + 0.5) / (df + 0.5)) if n > 0 else 0.0
 
     def score(self, query: str, idx: int) -> float:
-        q_terms = tokenize(query)
+        return self._score_terms(tokenize(query), idx)
+
+    def _score_terms(self, q_terms: list[str], idx: int) -> float:
         if not q_terms:
             return 0.0
         freqs = self.tf[idx]
@@ -104,26 +110,39 @@ class BM25Index:
         return score
 
     def topk(self, query: str, k: int = 8) -> list[tuple[int, float]]:
+        # Requête tokenisée une seule fois, pas une fois par chunk
+        q_terms = tokenize(query)
+        if not q_terms:
+            return []
         scored = []
         for i in range(len(self.chunks)):
-            s = self.score(query, i)
+            s = self._score_terms(q_terms, i)
             if s > 0:
                 scored.append((i, s))
         scored.sort(key=lambda x: x[1], reverse=True)
         return scored[:k]
 
 
-def path_allowed(path: str, include: Optional[Sequence[str]], exclude: Optional[Sequence[str]]) -> bool:
-    low = path.lower()
-    if exclude:
-        for ex in exclude:
-            if ex and ex.lower() in low:
-                return False
-    if include:
-        return any(inc.lower() in low for inc in include if inc)
+def _lower_patterns(patterns: Optional[Sequence[str]]) -> Optional[tuple[str, ...]]:
+    if not patterns:
+        return None
+    return tuple(p.lower() for p in patterns if p)
+
+
+def _path_allowed_lower(
+    low: str, include: Optional[tuple[str, ...]], exclude: Optional[tuple[str, ...]]
+) -> bool:
+    if exclude and any(ex in low for ex in exclude):
+        return False
+    if include is not None:
+        return any(inc in low for inc in include)
     return True
 
 
+def path_allowed(path: str, include: Optional[Sequence[str]], exclude: Optional[Sequence[str]]) -> bool:
+    return _path_allowed_lower(path.lower(), _lower_patterns(include), _lower_patterns(exclude))
+
+
 def make_chunks(
     payload: dict,
     *,
@@ -134,9 +153,12 @@ def make_chunks(
 ) -> list[Chunk]:
     docs = payload.get("documents", [])
     chunks: list[Chunk] = []
+    # Motifs mis en minuscules une fois pour tout le lot, pas une fois par document
+    include_low = _lower_patterns(include)
+    exclude_low = _lower_patterns(exclude)
     for d in docs:
         src = d.get("path", "")
-        if not path_allowed(src, include, exclude):
+        if not _path_allowed_lower(src.lower(), include_low, exclude_low):
             continue
         ext = d.get("ext", "")
         text = d.get("text", "") or ""
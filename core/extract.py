@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
@@ -16,6 +17,8 @@ from typing import Optional
 
 import fitz  # PyMuPDF
 from docx import Document
+from docx.oxml.ns import nsmap as DOCX_NSMAP
+from lxml import etree
 
 from .errors import Result, ExtractionError
 from .logger import get_logger
@@ -23,27 +26,61 @@ from .models import SourceDoc
 
 LOG = get_logger("core.extract")
 
+MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
 SUPPORTED_DIRECT = {".pdf", ".docx", ".txt"}
 SUPPORTED_SOFFICE = {".doc", ".rtf", ".odt", ".docm", ".dot", ".dotx", ".dotm"}
+# À incrémenter si le format de sortie de extract_pdf/extract_docx change
+EXTRACT_CACHE_VERSION = 1
 
 
 def sha256_text(text: str) -> str:
+    # hashlib délègue à OpenSSL (SHA-NI si disponible) : ne pas remplacer par une implémentation Python.
     return hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
 
 
 def normalize_text(text: str) -> str:
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # Sans \r (cas courant) on évite les deux passes de replace
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = MULTI_NEWLINE_RE.sub("\n\n", text)
     return text.strip()
 
 
-def file_mtime_iso(path: Path) -> str:
+def file_mtime_iso(path: Path, stat: Optional[os.stat_result] = None) -> str:
+    """mtime ISO du fichier; ``stat`` évite un second appel système si déjà obtenu."""
     try:
-        return datetime.fromtimestamp(path.stat().st_mtime).isoformat(timespec="seconds")
+        st = stat if stat is not None else path.stat()
+        return datetime.fromtimestamp(st.st_mtime).isoformat(timespec="seconds")
     except Exception:
         return ""
 
 
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _size_and_mtime(path: Path, stat: Optional[os.stat_result] = None) -> tuple[int, str]:
+    """Taille et mtime ISO en un seul stat (``stat`` réutilisé si fourni); (0, "") si le fichier a disparu."""
+    st = stat if stat is not None else _stat_or_none(path)
+    if st is None:
+        return 0, ""
+    return st.st_size, file_mtime_iso(path, st)
+
+
+def _extract_pdf_document(doc: fitz.Document) -> dict:
+    pages_text = []
+    for i, page in enumerate(doc, start=1):
+        t = page.get_text("text") or ""
+        t = normalize_text(t)
+        pages_text.append({"page": i, "text": t})
+    full_text = "\n\n".join(p["text"] for p in pages_text if p["text"]).strip()
+    LOG.debug("PDF extrait: %d pages, %d caractères", len(pages_text), len(full_text))
+    return {"text": full_text, "pages": pages_text}
+
+
 def extract_pdf(path: Path) -> Result[dict]:
     """Extrait le texte d'un PDF avec PyMuPDF.
     
@@ -55,21 +92,61 @@ def extract_pdf(path: Path) -> Result[dict]:
     """
     try:
         LOG.info("Extraction PDF: %s", path.name)
-        pages_text = []
         with fitz.open(path) as doc:
-            for i, page in enumerate(doc, start=1):
-                t = page.get_text("text") or ""
-                t = normalize_text(t)
-                pages_text.append({"page": i, "text": t})
-        full_text = "\n\n".join(p["text"] for p in pages_text if p["text"]).strip()
-        LOG.debug("PDF extrait: %d pages, %d caractères", len(pages_text), len(full_text))
-        return Result.ok({"text": full_text, "pages": pages_text})
+            return Result.ok(_extract_pdf_document(doc))
     except Exception as exc:
         error = ExtractionError(f"Échec extraction PDF {path.name}: {exc}")
         LOG.error("Erreur extraction PDF %s: %s", path.name, exc)
         return Result.fail(error)
 
 
+def extract_pdf_bytes(data: bytes, name: str = "<mémoire>") -> Result[dict]:
+    """Extrait le texte d'un PDF déjà en mémoire (upload, archive...), sans passer par le disque.
+    
+    Args:
+        data: Contenu binaire du PDF
+        name: Nom affiché dans les logs et messages d'erreur
+        
+    Returns:
+        Result[dict]: Succès avec {"text", "pages"} ou échec avec ExtractionError
+    """
+    try:
+        LOG.info("Extraction PDF: %s", name)
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return Result.ok(_extract_pdf_document(doc))
+    except Exception as exc:
+        error = ExtractionError(f"Échec extraction PDF {name}: {exc}")
+        LOG.error("Erreur extraction PDF %s: %s", name, exc)
+        return Result.fail(error)
+
+
+# Mêmes chemins que CT_P.text / CT_R.text de python-docx, mais compilés une fois:
+# python-docx recompile son XPath à chaque paragraphe et à chaque run.
+# Copie de code interne (tout comme cell._tc plus bas): python-docx est épinglé dans
+# requirements.txt / pyproject.toml et test_extract_docx_matches_public_api compare
+# extract_docx à paragraph.text / cell.paragraphs avant toute montée de version.
+_P_CONTENT_XPATH = etree.XPath("w:r | w:hyperlink", namespaces=DOCX_NSMAP)
+_HYPERLINK_RUNS_XPATH = etree.XPath("w:r", namespaces=DOCX_NSMAP)
+_R_CONTENT_XPATH = etree.XPath("w:br | w:cr | w:noBreakHyphen | w:ptab | w:t | w:tab", namespaces=DOCX_NSMAP)
+_W_RUN_TAG = f"{{{DOCX_NSMAP['w']}}}r"
+
+
+def _run_text(r_el) -> str:
+    # str() des éléments oxml: w:tab -> "\t", w:br -> "\n", etc.
+    return "".join(str(e) for e in _R_CONTENT_XPATH(r_el))
+
+
+def _paragraph_text(p_el) -> str:
+    """Texte d'un <w:p>, identique à ``Paragraph.text``."""
+    parts = []
+    for el in _P_CONTENT_XPATH(p_el):
+        if el.tag == _W_RUN_TAG:
+            parts.append(_run_text(el))
+        else:
+            parts.extend(_run_text(r) for r in _HYPERLINK_RUNS_XPATH(el))
+    return "".join(parts)
+
+
 def extract_docx(path: Path) -> Result[dict]:
     """Extrait le texte d'un DOCX avec python-docx.
     
@@ -83,13 +160,15 @@ def extract_docx(path: Path) -> Result[dict]:
         LOG.info("Extraction DOCX: %s", path.name)
         doc = Document(path)
         parts: list[str] = []
-        for p in doc.paragraphs:
-            t = (p.text or "").strip()
+        for p_el in doc.element.body.p_lst:
+            t = _paragraph_text(p_el).strip()
             if t:
                 parts.append(t)
         for table in doc.tables:
             for row in table.rows:
-                cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+                # row.cells garde la résolution des cellules fusionnées; texte lu une fois par cellule
+                cell_texts = ("\n".join(_paragraph_text(p) for p in cell._tc.p_lst).strip() for cell in row.cells)
+                cells = [t for t in cell_texts if t]
                 if cells:
                     parts.append(" | ".join(cells))
         full_text = normalize_text("\n".join(parts))
@@ -193,13 +272,81 @@ def walk_files(root: Path) -> list[Path]:
     return sorted([p for p in root.rglob("*") if p.is_file() and not _is_hidden(p.relative_to(root))])
 
 
+def _extract_cache_path(cache_dir: Path, path: Path) -> Path:
+    return cache_dir / (hashlib.sha1(str(path).encode("utf-8", errors="surrogateescape")).hexdigest() + ".json")
+
+
+def _cache_key(st: os.stat_result) -> list[int]:
+    return [EXTRACT_CACHE_VERSION, st.st_size, st.st_mtime_ns]
+
+
+def _read_extract_cache(cache_dir: Path, path: Path, st: os.stat_result) -> Optional[dict]:
+    """Relit une extraction en cache si taille et mtime (ns) du fichier n'ont pas bougé."""
+    try:
+        cached = json.loads(_extract_cache_path(cache_dir, path).read_bytes())
+        if cached.get("path") != str(path) or cached.get("key") != _cache_key(st):
+            return None
+        return cached["result"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _write_extract_cache(cache_dir: Path, path: Path, st: os.stat_result, value: dict) -> None:
+    """Écrit l'extraction en cache (best effort, remplacement atomique)."""
+    try:
+        payload = json.dumps(
+            {"path": str(path), "key": _cache_key(st), "result": value},
+            ensure_ascii=False,
+        )
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = _extract_cache_path(cache_dir, path)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=cache_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _cached_extract(
+    parser, path: Path, cache_dir: Optional[Path], st: Optional[os.stat_result]
+) -> Result[dict]:
+    """Appelle ``parser`` sauf si un cache valide existe pour ``path``; seuls les succès sont mis en cache.
+
+    ``st`` est le stat du fichier pris par l'appelant: la clé du cache et les
+    métadonnées du SourceDoc viennent ainsi du même appel système.
+    """
+    if cache_dir is None or st is None:
+        return parser(path)
+    cached = _read_extract_cache(cache_dir, path, st)
+    if cached is not None:
+        LOG.debug("Cache extraction: %s", path.name)
+        return Result.ok(cached)
+    result = parser(path)
+    if result.success:
+        _write_extract_cache(cache_dir, path, st, result.value)
+    return result
+
+
 def extract_sources(
     root: Path,
     *,
     enable_soffice: bool = False,
     include_extensions: Optional[Sequence[str]] = None,
+    cache_dir: Optional[Path] = None,
 ) -> dict:
+    """Extrait tous les documents supportés sous ``root``.
+
+    ``cache_dir`` active un cache JSON des extractions PDF/DOCX, invalidé dès
+    que la taille ou le mtime (ns) du fichier change.
+    """
     root = Path(root).expanduser().resolve()
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir).expanduser()
     if not root.exists() or not root.is_dir():
         raise FileNotFoundError(f"Dossier introuvable: {root}")
 
@@ -218,13 +365,15 @@ def extract_sources(
 
         result: Optional[Result[dict]] = None
         extractor = "unknown"
+        # Un seul stat par source: clé du cache et taille/mtime du SourceDoc
+        st = _stat_or_none(path)
         
         try:
             if ext == ".pdf":
-                result = extract_pdf(path)
+                result = _cached_extract(extract_pdf, path, cache_dir, st)
                 extractor = "pymupdf"
             elif ext == ".docx":
-                result = extract_docx(path)
+                result = _cached_extract(extract_docx, path, cache_dir, st)
                 extractor = "python-docx"
             elif ext == ".txt":
                 result = extract_txt(path)
@@ -242,11 +391,12 @@ def extract_sources(
                 
             if result and result.success:
                 data = result.value
+                size_bytes, mtime_iso = _size_and_mtime(path, st)
                 doc = SourceDoc(
                     path=str(path),
                     ext=ext,
-                    size_bytes=path.stat().st_size,
-                    mtime_iso=file_mtime_iso(path),
+                    size_bytes=size_bytes,
+                    mtime_iso=mtime_iso,
                     extractor=extractor,
                     text=data["text"],
                     text_sha256=sha256_text(data["text"]),
@@ -256,12 +406,13 @@ def extract_sources(
                 ok += 1
             elif result:
                 # Échec explicite avec Result.fail
+                size_bytes, mtime_iso = _size_and_mtime(path, st)
                 documents.append(
                     SourceDoc(
                         path=str(path),
                         ext=ext,
-                        size_bytes=path.stat().st_size if path.exists() else 0,
-                        mtime_iso=file_mtime_iso(path),
+                        size_bytes=size_bytes,
+                        mtime_iso=mtime_iso,
                         extractor="error",
                         text="",
                         text_sha256=sha256_text(""),
@@ -272,12 +423,13 @@ def extract_sources(
                 errors += 1
         except Exception as exc:
             # Gestion des exceptions imprévues
+            size_bytes, mtime_iso = _size_and_mtime(path, st)
             documents.append(
                 SourceDoc(
                     path=str(path),
                     ext=ext,
-                    size_bytes=path.stat().st_size if path.exists() else 0,
-                    mtime_iso=file_mtime_iso(path),
+                    size_bytes=size_bytes,
+                    mtime_iso=mtime_iso,
                     extractor="error",
                     text="",
                     text_sha256=sha256_text(""),
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import re
 from collections.abc import Callable, Sequence
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 from urllib import request
@@ -27,6 +28,8 @@ DEFAULT_FIELDS = [
 
 RE_JSON = re.compile(r"\A\s*[{[]")
 RE_CODEBLOCK = re.compile(r"```|\bjson\b", re.IGNORECASE)
+RE_JSON_WORD = re.compile(r"\bjson\b", re.IGNORECASE)
+RE_JSON_PREFIX = re.compile(r"^json[:\s]+", re.IGNORECASE)
 
 # Sorties interdites: placeholders, traces de sources, etc.
 RE_FORBIDDEN_PLACEHOLDERS = re.compile(r"\{\{|\}\}")
@@ -136,15 +139,19 @@ def check_llm_status(host: str, model: Optional[str] = None, timeout: float = 3.
 
 
 def sanitize_output(text: str) -> str:
+    # str.replace reste plus rapide qu'une alternation regex pour ces deux littéraux
     text = text.replace("```", " ")
     text = text.replace("\u200b", " ")
-    text = re.sub(r"(?i)^json[:\s]+", "", text.strip())
+    text = RE_JSON_PREFIX.sub("", text.strip())
     return text.strip()
 
 
 def looks_like_json_or_markdown(text: str) -> bool:
-    stripped = text.strip()
-    return bool(RE_JSON.match(stripped) or RE_CODEBLOCK.search(stripped))
+    # Équivalent à RE_CODEBLOCK.search, mais les recherches littérales (memchr) filtrent
+    # avant la regex insensible à la casse, qui ne tourne que si "json" apparaît.
+    if RE_JSON.match(text) or "```" in text:
+        return True
+    return "json" in text.casefold() and RE_JSON_WORD.search(text) is not None
 
 
 def find_forbidden_output_reasons(text: str) -> list[str]:
@@ -173,10 +180,12 @@ def find_forbidden_output_reasons(text: str) -> list[str]:
 
 
 def truncate_lines(text: str, max_lines: int) -> str:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    if max_lines and len(lines) > max_lines:
-        lines = lines[:max_lines]
-    return "\n".join(lines)
+    # strip() une seule fois par ligne et arrêt dès max_lines lignes non vides
+    lines = (stripped for ln in text.splitlines() if (stripped := ln.strip()))
+    if max_lines and max_lines < 0:
+        # Sémantique de slice conservée: -n retire les n dernières lignes
+        return "\n".join(list(lines)[:max_lines])
+    return "\n".join(islice(lines, max_lines or None))
 
 
 def truncate_chars(text: str, max_chars: int) -> str:
@@ -94,10 +94,9 @@ def _trim_near_white(im: Image.Image, *, near_white_threshold: int, alpha_thresh
 
     # Marquer comme "background" les pixels (1) presque blancs ET (2) opaques.
     # On conserve l'info alpha pour ne pas considérer des zones transparentes comme "blanc".
-    def _bg_mask_channel(ch: Image.Image) -> Image.Image:
-        return ch.point(lambda x: 255 if x >= near_white_threshold else 0)
-
-    bg_rgb = ImageChops.multiply(ImageChops.multiply(_bg_mask_channel(r), _bg_mask_channel(g)), _bg_mask_channel(b))
+    # Presque blanc sur les 3 canaux <=> min(r, g, b) >= seuil: un seul seuillage sur le min.
+    min_rgb = ImageChops.darker(ImageChops.darker(r, g), b)
+    bg_rgb = min_rgb.point(lambda x: 255 if x >= near_white_threshold else 0)
     opaque = a.point(lambda x: 255 if x > alpha_threshold else 0)
     bg = ImageChops.multiply(bg_rgb, opaque)
 
@@ -2,42 +2,44 @@
 
 from __future__ import annotations
 
+import os
 import re
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Optional, Union
 
 from docx import Document
+from docx.oxml.ns import qn
 
 from .field_specs import get_field_spec
 
 PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
 
 
-def extract_placeholders_from_docx(template_path: Path) -> list[str]:
-    """Retourne les placeholders uniques trouvés dans un template DOCX."""
+def extract_placeholders_from_docx(template_path: Union[str, os.PathLike[str], IO[bytes]]) -> list[str]:
+    """Retourne les placeholders uniques trouvés dans un template DOCX.
 
-    doc = Document(str(Path(template_path).expanduser().resolve()))
-    placeholders: list[str] = []
+    Accepte un chemin ou un flux binaire déjà ouvert (ex. io.BytesIO d'un upload).
+    """
 
-    def register(text: str) -> None:
-        if not text:
-            return
-        for match in PLACEHOLDER_RE.findall(text):
-            key = match.strip()
-            if key and key not in placeholders:
-                placeholders.append(key)
+    if isinstance(template_path, (str, os.PathLike)):
+        doc = Document(str(Path(template_path).expanduser().resolve()))
+    else:
+        doc = Document(template_path)
+    # dict ordonné: dédoublonnage en O(1) en conservant l'ordre d'apparition
+    placeholders: dict[str, None] = {}
 
-    for paragraph in doc.paragraphs:
-        register(paragraph.text)
-
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    register(paragraph.text)
+    # Lecture directe du XML (corps + cellules, y compris tableaux imbriqués) sans
+    # construire d'objets python-docx par ligne/cellule. Les runs d'un même
+    # paragraphe sont joints avant la recherche: un {{NOM}} découpé en plusieurs
+    # <w:r> est donc détecté, sans jamais raccorder deux paragraphes distincts.
+    for par in doc.element.body.iter(qn("w:p")):
+        text = "".join(par.xpath("./w:r/w:t/text() | ./w:hyperlink/w:r/w:t/text()"))
+        if "{{" not in text:
+            continue
+        placeholders.update(dict.fromkeys(key for match in PLACEHOLDER_RE.findall(text) if (key := match.strip())))
 
-    return placeholders
+    return list(placeholders)
 
 
 def build_field_specs(
@@ -6,6 +6,9 @@ import re
 from typing import Dict, Any, Optional, List
 
 
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+
 class InlineExtractor:
     """Extrait les sous-sections depuis le texte d'une section parent"""
     
@@ -25,6 +28,13 @@ class InlineExtractor:
         }
     }
     
+    # Compilés une seule fois à l'import: extract_inline_subsections() crée une
+    # instance par appel, un cache par instance ne servirait à rien
+    COMPILED_PATTERNS = {
+        section_id: {key: re.compile(pattern) for key, pattern in patterns.items()}
+        for section_id, patterns in PATTERNS.items()
+    }
+    
     def extract_subsections(self, section_id: str, content: str) -> Optional[Dict[str, str]]:
         """
         Tente d'extraire les sous-sections depuis le contenu d'une section parent
@@ -39,15 +49,15 @@ class InlineExtractor:
         if not content or section_id not in self.PATTERNS:
             return None
         
-        patterns = self.PATTERNS[section_id]
+        patterns = self.COMPILED_PATTERNS[section_id]
         result = {}
         
         for key, pattern in patterns.items():
-            match = re.search(pattern, content)
+            match = pattern.search(content)
             if match:
                 extracted = match.group(1).strip()
                 # Nettoyer les sauts de lignes multiples
-                extracted = re.sub(r'\n\s*\n', '\n', extracted)
+                extracted = BLANK_LINES_RE.sub('\n', extracted)
                 result[key] = extracted
             else:
                 result[key] = ""
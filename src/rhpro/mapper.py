@@ -17,6 +17,9 @@ IGNORE_PATTERNS = [
     r"^BILAN\s+PROFESSIONNEL",
 ]
 
+# Alternation unique compilée à l'import: un seul search par titre
+IGNORE_RE = re.compile("|".join(f"(?:{p})" for p in IGNORE_PATTERNS), re.IGNORECASE)
+
 
 class TitleMapper:
     """Map les titres détectés vers les sections canoniques du ruleset"""
@@ -45,10 +48,7 @@ class TitleMapper:
     
     def _should_ignore_title(self, title: str) -> bool:
         """Vérifie si un titre doit être ignoré (titre de document générique)"""
-        for pattern in IGNORE_PATTERNS:
-            if re.search(pattern, title, re.IGNORECASE):
-                return True
-        return False
+        return IGNORE_RE.search(title) is not None
     
     def _find_best_match(self, title: str) -> Optional[Dict[str, Any]]:
         """
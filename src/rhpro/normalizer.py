@@ -2,6 +2,7 @@
 Normalizer — construit le dictionnaire normalisé de sortie
 """
 import json
+import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -10,6 +11,14 @@ from .ruleset_loader import RulesetLoader
 from .inline_extractor import InlineExtractor
 
 
+# Signaux de titres pour la sélection du profil de production gate.
+# 'stage' couvre aussi "bilan de stage" / "orientation formation stage".
+STAGE_TITLE_KEYWORD = 'stage'
+# Ordre de priorité d'origine si un même titre cite plusieurs LAI
+LAI_KEYWORDS = ('lai 15', 'lai15', 'lai 18', 'lai18', 'lai-15', 'lai-18')
+LAI_TITLE_RE = re.compile(r"lai[ -]?1[58]")
+
+
 class Normalizer:
     """Construit le dictionnaire normalisé à partir des segments mappés"""
     
@@ -506,16 +515,12 @@ class Normalizer:
         
         # Collecter UNIQUEMENT les titres normalisés (headings détectés)
         # PAS le contenu des paragraphes pour éviter faux positifs
-        heading_titles = []
-        for segment in segments:
-            if segment.normalized_title:
-                heading_titles.append(segment.normalized_title.lower())
+        # (dédupliqués, en minuscules)
+        heading_titles = {segment.normalized_title.lower() for segment in segments if segment.normalized_title}
         
-        # Collecter les section_ids mappés (source fiable)
-        found_section_ids = [s.get('section_id', '') for s in found_sections if s.get('section_id')]
-        
-        # Dédupliquer les titres
-        heading_titles = list(set(heading_titles))
+        # Collecter les section_ids mappés (source fiable), minuscules calculées une seule fois
+        found_section_ids = [sid for sid in (s.get('section_id') for s in found_sections) if sid]
+        section_ids_lower = [sid.lower() for sid in found_section_ids]
         
         # === CALCUL DES SIGNAUX (depuis headings/section_ids UNIQUEMENT) ===
         signals = {
@@ -531,24 +536,18 @@ class Normalizer:
         }
         
         # Signal 1: Détection "stage" dans TITRES ou section_ids
-        stage_keywords = ['stage', 'bilan de stage', 'orientation formation stage']
         for title in heading_titles:
-            for keyword in stage_keywords:
-                if keyword in title:
-                    signals['has_stage'] = True
-                    # Tronquer à 40 chars pour lisibilité
-                    signals['matched_titles'].append(f"stage:{title[:40]}")
-                    break
+            if STAGE_TITLE_KEYWORD in title:
+                signals['has_stage'] = True
+                # Tronquer à 40 chars pour lisibilité
+                signals['matched_titles'].append(f"stage:{title[:40]}")
         
         # Vérifier section_ids pour stage
-        for section_id in found_section_ids:
-            if 'stage' in section_id.lower():
-                signals['has_stage'] = True
-                break
+        if any('stage' in sid for sid in section_ids_lower):
+            signals['has_stage'] = True
         
         # Signal 2: Sections bilan complet
-        for section_id in found_section_ids:
-            section_id_lower = section_id.lower()
+        for section_id, section_id_lower in zip(found_section_ids, section_ids_lower):
             if section_id.startswith('tests') or 'tests' == section_id_lower:
                 signals['has_tests'] = True
                 signals['bilan_complet_sections_count'] += 1
@@ -562,17 +561,17 @@ class Normalizer:
                 signals['has_ressources_professionnelles'] = True
                 signals['bilan_complet_sections_count'] += 1
         
-        # Signal 3: Détection LAI dans TITRES
-        lai_keywords = ['lai 15', 'lai15', 'lai 18', 'lai18', 'lai-15', 'lai-18']
+        # Signal 3: Détection LAI dans TITRES (un seul passage regex par titre)
         for title in heading_titles:
-            for keyword in lai_keywords:
-                if keyword in title:
-                    if '15' in keyword:
-                        signals['has_lai15'] = True
-                    else:
-                        signals['has_lai18'] = True
-                    signals['matched_titles'].append(f"lai:{title[:40]}")
-                    break
+            hits = {m.group(0) for m in LAI_TITLE_RE.finditer(title)}
+            if not hits:
+                continue
+            keyword = next(k for k in LAI_KEYWORDS if k in hits)
+            if '15' in keyword:
+                signals['has_lai15'] = True
+            else:
+                signals['has_lai18'] = True
+            signals['matched_titles'].append(f"lai:{title[:40]}")
         
         # === SCORING DÉTERMINISTE PAR PROFIL ===
         scores = {
@@ -585,7 +584,8 @@ class Normalizer:
         if signals['has_stage']:
             scores['stage'] += 100  # Signal fort exclusif
         # Sections orientation_formation
-        if 'orientation_formation' in found_section_ids or any('orientation' in sid.lower() for sid in found_section_ids):
+        # ('orientation_formation' contient 'orientation': un seul test suffit)
+        if any('orientation' in sid for sid in section_ids_lower):
             scores['stage'] += 20
         
         # Profil BILAN_COMPLET: sections spécifiques (tests, vocation, profil_emploi)
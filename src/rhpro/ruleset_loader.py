@@ -1,16 +1,76 @@
 """
 RH-Pro ruleset loader — charge et valide le YAML de configuration
 """
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML installé sans libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+def _json_cache_path(cache_dir: Path, yaml_path: Path) -> Path:
+    digest = hashlib.sha1(str(yaml_path.resolve()).encode('utf-8', errors='surrogateescape')).hexdigest()
+    return cache_dir / f"ruleset-{digest}.json"
+
+
+def _cache_key(st: os.stat_result) -> List[int]:
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_json_cache(cache_dir: Path, yaml_path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Relit le ruleset depuis le cache JSON si taille et mtime (ns) du YAML n'ont pas bougé"""
+    try:
+        cached = json.loads(_json_cache_path(cache_dir, yaml_path).read_bytes())
+        if cached.get('key') != _cache_key(st):
+            return None
+        return cached['data']
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _write_json_cache(cache_dir: Path, yaml_path: Path, st: os.stat_result, data: Dict[str, Any]) -> None:
+    """Écrit le cache JSON dans ``cache_dir`` (best effort, remplacement atomique)
+    
+    Ignoré si le dossier n'est pas inscriptible ou si le YAML contient des
+    valeurs que JSON ne restitue pas à l'identique (dates, clés non str...).
+    """
+    try:
+        if json.loads(json.dumps(data, ensure_ascii=False)) != data:
+            return
+        payload = json.dumps({'key': _cache_key(st), 'data': data}, ensure_ascii=False)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = _json_cache_path(cache_dir, yaml_path)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=cache_path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
 
 class RulesetLoader:
-    """Charge et expose la configuration du ruleset RH-Pro"""
+    """Charge et expose la configuration du ruleset RH-Pro
+    
+    ``cache_dir`` active un cache JSON du YAML parsé, invalidé dès que la
+    taille ou le mtime (ns) du YAML change. Sans lui, rien n'est écrit.
+    """
     
-    def __init__(self, ruleset_path: str):
+    def __init__(self, ruleset_path: str, cache_dir: Optional[Path] = None):
         self.ruleset_path = Path(ruleset_path)
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
         self._data: Dict[str, Any] = {}
         self._load()
     
@@ -19,8 +79,13 @@ class RulesetLoader:
         if not self.ruleset_path.exists():
             raise FileNotFoundError(f"Ruleset not found: {self.ruleset_path}")
         
-        with open(self.ruleset_path, 'r', encoding='utf-8') as f:
-            self._data = yaml.safe_load(f)
+        st = self.ruleset_path.stat()
+        self._data = _read_json_cache(self.cache_dir, self.ruleset_path, st) if self.cache_dir else None
+        if self._data is None:
+            with open(self.ruleset_path, 'r', encoding='utf-8') as f:
+                self._data = yaml.load(f, Loader=_SafeLoader)
+            if self.cache_dir:
+                _write_json_cache(self.cache_dir, self.ruleset_path, st, self._data)
         
         # Validation basique
         required_keys = ['version', 'language', 'doc_type', 'sections']
@@ -124,6 +189,25 @@ class RulesetLoader:
         collect_required(self.sections)
         return required
 
-def load_ruleset(ruleset_path: str) -> RulesetLoader:
-    """Fonction helper pour charger un ruleset"""
-    return RulesetLoader(ruleset_path)
+@lru_cache(maxsize=16)
+def _load_ruleset_cached(resolved_path: str, size: int, mtime_ns: int, cache_dir: Optional[Path]) -> RulesetLoader:
+    return RulesetLoader(resolved_path, cache_dir=cache_dir)
+
+
+def load_ruleset(ruleset_path: str, cache_dir: Optional[Path] = None) -> RulesetLoader:
+    """Fonction helper pour charger un ruleset
+    
+    Mémoïsé sur (chemin résolu, taille, mtime): le YAML n'est reparsé que s'il
+    a été modifié, avec la même clé que le cache JSON. Chaque appel reçoit une
+    copie profonde de l'instance mémoïsée (bien moins chère que le parsing
+    YAML): un appelant qui modifie ses sections n'affecte pas les autres.
+    ``cache_dir`` est transmis à RulesetLoader (cache JSON sur disque).
+    """
+    path = Path(ruleset_path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        # Pas de mise en cache: RulesetLoader lève l'erreur habituelle
+        return RulesetLoader(ruleset_path, cache_dir=cache_dir)
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    return copy.deepcopy(_load_ruleset_cached(str(path.resolve()), st.st_size, st.st_mtime_ns, cache_dir))
@@ -9,7 +9,7 @@ from .docx_structure import Paragraph
 from .ruleset_loader import RulesetLoader
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """Représente un segment (titre + paragraphes associés)"""
     raw_title: str
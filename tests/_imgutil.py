@@ -0,0 +1,31 @@
+"""Utilitaires image partagés par les tests de logos."""
+
+from __future__ import annotations
+
+import functools
+
+from PIL import Image, ImageChops  # type: ignore
+
+
+@functools.lru_cache(maxsize=None)
+def _lut(threshold: int, *, above: bool) -> tuple[int, ...]:
+    # Table 256 entrées appliquée en C par Image.point (aucun appel Python par pixel)
+    if above:
+        return tuple(255 if x > threshold else 0 for x in range(256))
+    return tuple(255 if x < threshold else 0 for x in range(256))
+
+
+def bbox(im: Image.Image, *, alpha_thr: int = 8, dark_thr: int | None = None) -> tuple[int, int, int, int]:
+    """Bounding box du contenu: alpha > alpha_thr et, si dark_thr, max(r, g, b) < dark_thr."""
+    if im.mode != "RGBA":
+        im = im.convert("RGBA")
+    r, g, b, a = im.split()
+    mask = a.point(_lut(alpha_thr, above=True))
+    if dark_thr is not None:
+        # max(r, g, b) < seuil  <=>  chaque canal < seuil: ET logique = min des masques
+        dark = _lut(dark_thr, above=False)
+        for ch in (r, g, b):
+            mask = ImageChops.darker(mask, ch.point(dark))
+    box = mask.getbbox()
+    assert box is not None
+    return box
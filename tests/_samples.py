@@ -0,0 +1,25 @@
+"""Localisation des documents d'exemple RH-Pro partagée par les tests."""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+from typing import Optional
+
+SAMPLES_DIR = Path(__file__).parent.parent / "data" / "samples"
+
+
+@functools.lru_cache(maxsize=1)
+def find_sample_docx() -> Optional[Path]:
+    """Premier data/samples/<client>/source.docx (ordre alphabétique), ou None.
+
+    Parcours sur deux niveaux seulement (disposition de data/samples): pas de
+    descente récursive dans tout l'arbre, et un seul parcours par processus.
+    """
+    if not SAMPLES_DIR.is_dir():
+        return None
+    for client_dir in sorted(SAMPLES_DIR.iterdir()):
+        candidate = client_dir / "source.docx"
+        if candidate.is_file():
+            return candidate
+    return None
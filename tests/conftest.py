@@ -1,10 +1,43 @@
 """Configuration pytest partagée pour tous les tests."""
 
+import copy
+import io
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+RULESET_PATH = Path(__file__).parent.parent / "config" / "rulesets" / "rhpro_v1.yaml"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports() -> None:
+    """Importe une fois par worker les extensions lourdes et les modules core testés.
+
+    Le coût de chargement (dlopen, enregistrement des plugins, parsing du template
+    python-docx par défaut) sort ainsi du premier test qui les utilise.
+    """
+    import fitz  # noqa: F401
+    import PIL.Image  # noqa: F401
+    import PIL.ImageChops  # noqa: F401
+    import PIL.ImageDraw  # noqa: F401
+    from docx import Document
+
+    import core.extract  # noqa: F401
+    import core.generate  # noqa: F401
+    import core.location_date  # noqa: F401
+    import core.logo_processing  # noqa: F401
+
+    Document()
+
+    # Plugins PNG/JPEG de Pillow chargés ici plutôt qu'au premier test d'images
+    for fmt in ("PNG", "JPEG"):
+        buf = io.BytesIO()
+        PIL.Image.new("RGB", (1, 1)).save(buf, format=fmt)
+        buf.seek(0)
+        with PIL.Image.open(buf) as im:
+            im.load()
+
 
 @pytest.fixture
 def sample_payload() -> dict[str, Any]:
@@ -41,3 +74,144 @@ def temp_client_dir(tmp_path: Path) -> Path:
 def mock_llm_response() -> str:
     """Réponse LLM type pour les tests."""
     return "Développeur Python"
+
+
+@pytest.fixture(scope="session")
+def _blank_document() -> Any:
+    """Document python-docx vierge, construit une fois (lecture du default.docx embarqué)."""
+    from docx import Document
+
+    return Document()
+
+
+@pytest.fixture
+def fresh_doc(_blank_document: Any) -> Any:
+    """Copie indépendante du document vierge: deepcopy ~3x plus rapide que Document()."""
+    return copy.deepcopy(_blank_document)
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_bytes() -> bytes:
+    """PDF de 3 pages ("Page N: Contenu de test"), sérialisé une fois par session."""
+    import fitz
+
+    with fitz.open() as doc:
+        for i in range(3):
+            page = doc.new_page()
+            page.insert_text((50, 50 + i * 20), f"Page {i + 1}: Contenu de test")
+        return doc.tobytes()
+
+
+@pytest.fixture(scope="session")
+def sample_complex_docx_bytes() -> bytes:
+    """DOCX avec titres, paragraphes et tableau 2x2, sérialisé une fois par session."""
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("Titre Principal", level=1)
+    doc.add_paragraph("Paragraphe 1 avec du texte.")
+    doc.add_heading("Sous-titre", level=2)
+    doc.add_paragraph("Paragraphe 2 avec plus de contenu.")
+
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "A1"
+    table.cell(0, 1).text = "A2"
+    table.cell(1, 0).text = "B1"
+    table.cell(1, 1).text = "B2"
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def table_docx_bytes() -> bytes:
+    """DOCX avec un tableau 2x2 de placeholders ({{HEADER1}}, ..., {{DATA2}})."""
+    from docx import Document
+
+    doc = Document()
+    table = doc.add_table(rows=2, cols=2)
+    for row, col, value in (
+        (0, 0, "{{HEADER1}}"),
+        (0, 1, "{{HEADER2}}"),
+        (1, 0, "{{DATA1}}"),
+        (1, 1, "{{DATA2}}"),
+    ):
+        table.cell(row, col).text = value
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def sample_utf8_txt_bytes() -> bytes:
+    """Texte UTF-8 avec caractères accentués et symboles monétaires."""
+    return "Texte avec éàü ñ ç œ\nLigne 2\nLigne 3 €£¥".encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def multipage_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """PDF de 2 pages ("Page N content") écrit une fois par session."""
+    import fitz
+
+    path = tmp_path_factory.mktemp("pdf") / "multipage.pdf"
+    with fitz.open() as doc:
+        for i in (1, 2):
+            page = doc.new_page()
+            page.insert_text((50, 50), f"Page {i} content")
+        doc.save(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def multi_docx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """DOCX de 5 paragraphes ("Paragraphe N") écrit une fois par session."""
+    from docx import Document
+
+    path = tmp_path_factory.mktemp("docx") / "multi.docx"
+    doc = Document()
+    for i in range(5):
+        doc.add_paragraph(f"Paragraphe {i}")
+    doc.save(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def ruleset_path() -> Path:
+    """Chemin canonique du ruleset RH-Pro versionné dans config/rulesets."""
+    return RULESET_PATH
+
+
+@pytest.fixture(scope="session")
+def ruleset(ruleset_path: Path) -> Any:
+    """Ruleset RH-Pro parsé une seule fois par session.
+
+    Lecture seule: un test qui doit le modifier travaille sur ``copy.deepcopy(ruleset)``.
+    """
+    from src.rhpro.ruleset_loader import load_ruleset
+
+    return load_ruleset(str(ruleset_path))
+
+
+@pytest.fixture(scope="session")
+def normalizer(ruleset: Any) -> Any:
+    """Normalizer partagé: ``normalize()`` réinitialise son état à chaque appel."""
+    from src.rhpro.normalizer import Normalizer
+
+    return Normalizer(ruleset)
+
+
+@pytest.fixture(scope="session")
+def parsed_bilan(ruleset_path: Path) -> dict[str, Any]:
+    """Parse complet du premier sample RH-Pro, une seule fois par session.
+
+    Partagé par test_rhpro_parse et test_rhpro_step6: lecture seule.
+    """
+    from _samples import find_sample_docx
+    from src.rhpro.parse_bilan import parse_bilan_docx_to_normalized
+
+    sample = find_sample_docx()
+    if sample is None:
+        pytest.skip("Sample DOCX not available")
+    return parse_bilan_docx_to_normalized(str(sample), str(ruleset_path))
@@ -11,7 +11,6 @@ from src.rhpro.batch_runner import discover_sources, run_batch
 # Utiliser des chemins relatifs depuis la racine du repo
 REPO_ROOT = Path(__file__).parent.parent
 SAMPLES_DIR = REPO_ROOT / "data" / "samples"
-RULESET_PATH = REPO_ROOT / "config" / "rulesets" / "rhpro_v1.yaml"
 
 
 @pytest.fixture
@@ -22,14 +21,6 @@ def samples_path():
     return SAMPLES_DIR
 
 
-@pytest.fixture
-def ruleset_path():
-    """Fixture pour le chemin vers le ruleset"""
-    if not RULESET_PATH.exists():
-        pytest.skip(f"Ruleset not found: {RULESET_PATH}")
-    return RULESET_PATH
-
-
 class TestDiscoverSources:
     """Tests pour la découverte de dossiers sources"""
     
@@ -1,34 +1,64 @@
 """Tests supplémentaires pour améliorer la couverture."""
 
+import io
+
 import pytest
 from pathlib import Path
-from core.extract import extract_pdf, extract_docx, extract_txt, sha256_text, normalize_text
+from core.extract import _paragraph_text, extract_pdf, extract_docx, extract_txt, sha256_text, normalize_text
 from core.avs import detect_avs_in_text, _normalize_avs
 from core.context import make_chunks, build_index
 from core.models import Chunk
 
 
+# Empreintes de référence calculées une seule fois à l'import du module
+TEST_HASH = sha256_text("test")
+TEXT1_HASH = sha256_text("text1")
+TEXT2_HASH = sha256_text("text2")
+
+
+def _build_pdf() -> bytes:
+    import fitz
+
+    with fitz.open() as doc:
+        page = doc.new_page()
+        page.insert_text((50, 50), "Test PDF Content")
+        return doc.tobytes()
+
+
+def _build_docx(*, paragraph: str | None = None, cell: str | None = None) -> bytes:
+    from docx import Document
+
+    doc = Document()
+    if paragraph is not None:
+        doc.add_paragraph(paragraph)
+    if cell is not None:
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = cell
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+# Documents sérialisés une fois à l'import: chaque test n'écrit que les octets
+_PDF_BYTES = _build_pdf()
+_DOCX_BYTES = _build_docx(paragraph="Test DOCX Content")
+_TABLE_DOCX_BYTES = _build_docx(cell="Cell Content")
+
+
 class TestSha256Text:
     """Tests pour le hachage de texte."""
 
     def test_generates_hash(self):
         """Génère un hash SHA256."""
-        result = sha256_text("test")
-        assert isinstance(result, str)
-        assert len(result) == 64  # SHA256 hex = 64 caractères
+        assert isinstance(TEST_HASH, str)
+        assert len(TEST_HASH) == 64  # SHA256 hex = 64 caractères
 
     def test_same_text_same_hash(self):
         """Même texte produit même hash."""
-        text = "hello world"
-        hash1 = sha256_text(text)
-        hash2 = sha256_text(text)
-        assert hash1 == hash2
+        assert sha256_text("hello world") == "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
 
     def test_different_text_different_hash(self):
         """Textes différents produisent hashes différents."""
-        hash1 = sha256_text("text1")
-        hash2 = sha256_text("text2")
-        assert hash1 != hash2
+        assert TEXT1_HASH != TEXT2_HASH
 
 
 class TestNormalizeTextExtract:
@@ -50,15 +80,8 @@ class TestExtractPdf:
 
     def test_extracts_pdf_content(self, tmp_path):
         """Extrait le contenu d'un PDF."""
-        import fitz
-        
-        doc = fitz.open()
-        page = doc.new_page()
-        page.insert_text((50, 50), "Test PDF Content")
-        
         pdf_file = tmp_path / "test.pdf"
-        doc.save(pdf_file)
-        doc.close()
+        pdf_file.write_bytes(_PDF_BYTES)
         
         result = extract_pdf(pdf_file)
         
@@ -72,12 +95,8 @@ class TestExtractDocx:
 
     def test_extracts_docx_content(self, tmp_path):
         """Extrait le contenu d'un DOCX."""
-        from docx import Document
-        
         docx_file = tmp_path / "test.docx"
-        doc = Document()
-        doc.add_paragraph("Test DOCX Content")
-        doc.save(docx_file)
+        docx_file.write_bytes(_DOCX_BYTES)
         
         result = extract_docx(docx_file)
         
@@ -87,13 +106,8 @@ class TestExtractDocx:
 
     def test_handles_tables(self, tmp_path):
         """Gère les tableaux."""
-        from docx import Document
-        
         docx_file = tmp_path / "table.docx"
-        doc = Document()
-        table = doc.add_table(rows=1, cols=1)
-        table.cell(0, 0).text = "Cell Content"
-        doc.save(docx_file)
+        docx_file.write_bytes(_TABLE_DOCX_BYTES)
         
         result = extract_docx(docx_file)
         
@@ -102,6 +116,74 @@ class TestExtractDocx:
         # Le texte du tableau devrait être extrait
         assert "Cell Content" in result.value["text"]
 
+    def test_paragraph_text_matches_python_docx(self, fresh_doc):
+        """_paragraph_text rend tabulations, sauts et hyperliens comme Paragraph.text."""
+        from docx.enum.text import WD_BREAK
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+
+        para = fresh_doc.add_paragraph("avant\tonglet")
+        para.add_run("ligne").add_break(WD_BREAK.LINE)
+        para.add_run("suite")
+        para._p.append(parse_xml(
+            f'<w:hyperlink {nsdecls("w")}><w:r><w:t xml:space="preserve"> lien</w:t></w:r>'
+            f'<w:r><w:tab/><w:t>fin</w:t></w:r></w:hyperlink>'
+        ))
+
+        assert _paragraph_text(para._p) == para.text == "avant\tongletligne\nsuite lien\tfin"
+
+    def test_extract_docx_matches_public_api(self, tmp_path, fresh_doc):
+        """extract_docx donne le même texte que paragraph.text / cell.paragraphs (garde-fou de version)."""
+        from docx import Document
+        from docx.enum.text import WD_BREAK
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+
+        def hyperlink(text):
+            return parse_xml(
+                f'<w:hyperlink {nsdecls("w")}><w:r><w:t xml:space="preserve">{text}</w:t></w:r>'
+                f'<w:r><w:tab/><w:br/><w:t>apres</w:t></w:r></w:hyperlink>'
+            )
+
+        para = fresh_doc.add_paragraph("avant\tonglet")
+        para.add_run("ligne").add_break(WD_BREAK.LINE)
+        para.add_run("page").add_break(WD_BREAK.PAGE)
+        para._p.append(hyperlink(" lien"))
+        special = fresh_doc.add_paragraph()
+        special._p.append(parse_xml(
+            f'<w:r {nsdecls("w")}><w:t>a</w:t><w:noBreakHyphen/><w:t>b</w:t><w:cr/>'
+            f'<w:ptab w:relativeTo="margin" w:alignment="right" w:leader="none"/><w:t>c</w:t></w:r>'
+        ))
+        table = fresh_doc.add_table(rows=2, cols=3)
+        table.cell(0, 0).merge(table.cell(0, 1)).text = "Fusion"
+        cell = table.cell(0, 2)
+        cell.text = "premier"
+        cell.add_paragraph("second")._p.append(hyperlink(" cellule"))
+        table.cell(1, 1).paragraphs[0].add_run("x").add_break(WD_BREAK.LINE)
+        docx_file = tmp_path / "parity.docx"
+        fresh_doc.save(docx_file)
+
+        reloaded = Document(docx_file)
+        parts = [t for p in reloaded.paragraphs if (t := p.text.strip())]
+        for row in reloaded.tables[0].rows:
+            cells = [t for c in row.cells if (t := "\n".join(p.text for p in c.paragraphs).strip())]
+            if cells:
+                parts.append(" | ".join(cells))
+
+        assert extract_docx(docx_file).value["text"] == normalize_text("\n".join(parts))
+
+    def test_merged_cells_keep_row_layout(self, tmp_path, fresh_doc):
+        """Une cellule fusionnée est répétée comme avec row.cells."""
+        table = fresh_doc.add_table(rows=1, cols=3)
+        table.cell(0, 0).merge(table.cell(0, 1)).text = "Fusion"
+        table.cell(0, 2).text = "Seule"
+        docx_file = tmp_path / "merged.docx"
+        fresh_doc.save(docx_file)
+
+        result = extract_docx(docx_file)
+
+        assert result.value["text"] == "Fusion | Fusion | Seule"
+
 
 class TestExtractTxt:
     """Tests pour l'extraction de fichiers texte."""
@@ -169,3 +251,32 @@ class TestNormalizeAvs:
         result = _normalize_avs("756.1234.5678.90")
         assert result == "756.1234.5678.90"
 
+
+class TestBuildIndex:
+    """Tests pour l'index BM25."""
+
+    PAYLOAD = {
+        "documents": [
+            {"path": "a.txt", "ext": ".txt", "text": "Parcours de formation en informatique."},
+            {"path": "b.txt", "ext": ".txt", "text": "Expérience de cuisinier puis formation."},
+            {"path": "c.txt", "ext": ".txt", "text": "Loisirs: randonnée."},
+        ]
+    }
+
+    def test_topk_matches_per_chunk_scores(self):
+        """topk classe les chunks selon score(), sans les chunks à 0."""
+        _, index = build_index(self.PAYLOAD)
+        query = "formation informatique"
+
+        expected = sorted(
+            ((i, index.score(query, i)) for i in range(len(index.chunks))),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        assert index.topk(query) == [(i, s) for i, s in expected if s > 0]
+        assert index.topk(query)[0][0] == 0
+
+    def test_topk_empty_query(self):
+        """Une requête sans terme utile ne retourne rien."""
+        _, index = build_index(self.PAYLOAD)
+        assert index.topk("le la de") == []
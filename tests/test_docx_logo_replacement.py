@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
 import io
+import struct
 import zipfile
+import zlib
 from pathlib import Path
 
 import pytest
@@ -9,35 +12,70 @@ from PIL import Image  # type: ignore
 
 from lxml import etree as ET  # type: ignore
 
+from _imgutil import bbox as _bbox
 from core.docx_branding import update_docx_header
 
+# Parseur lxml partagé (réutilisé par tous les ET.fromstring du module)
+_PARSER = ET.XMLParser(huge_tree=False, remove_blank_text=False)
 
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(data, zlib.crc32(tag))
+    return b"".join((struct.pack(">I", len(data)), tag, data, struct.pack(">I", crc)))
+
+
+def _solid_rgba_png(w: int, h: int, rgba: tuple[int, int, int, int]) -> bytes:
+    """PNG RGBA 8 bits de couleur unie, assemblé à la main (sans passer par PIL)."""
+    ihdr = struct.pack(">IIBBBBB", w, h, 8, 6, 0, 0, 0)
+    scanline = b"\x00" + bytes(rgba) * w  # filtre 0 + w pixels
+    # un seul join: le PNG final est alloué une fois, sans concaténations intermédiaires
+    return b"".join(
+        (
+            b"\x89PNG\r\n\x1a\n",
+            _png_chunk(b"IHDR", ihdr),
+            _png_chunk(b"IDAT", zlib.compress(scanline * h)),
+            _png_chunk(b"IEND", b""),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def _png_bytes(color=(255, 0, 0, 255), size=(32, 32)) -> bytes:
+    # bytes immuables: un seul encodage PNG par couple (couleur, taille) pour tout le module
+    return _solid_rgba_png(size[0], size[1], color)
+
+
+def _bbox_alpha(im: Image.Image, *, alpha_threshold: int = 8) -> tuple[int, int, int, int]:
+    return _bbox(im, alpha_thr=alpha_threshold)
+
+
+def _render_logo_once() -> bytes:
+    # logo avec "marges" (petit carré au centre)
     buf = io.BytesIO()
-    im = Image.new("RGBA", size, color)
-    im.save(buf, format="PNG")
+    with Image.new("RGBA", (80, 80), (0, 0, 0, 0)) as bg:
+        bg.paste((0, 255, 0, 255), (30, 30, 50, 50))
+        bg.save(buf, format="PNG", optimize=False, compress_level=1)
     return buf.getvalue()
 
 
-def _bbox_alpha(im: Image.Image, *, alpha_threshold: int = 8) -> tuple[int, int, int, int]:
-    im = im.convert("RGBA")
-    a = im.split()[-1]
-    mask = a.point(lambda x: 255 if x > alpha_threshold else 0)
-    bbox = mask.getbbox()
-    assert bbox is not None
-    return bbox
+_LOGO_PNG = _render_logo_once()
 
 
 def _make_docx(path: Path, files: dict[str, bytes]) -> None:
     # Docx minimal: notre code ne dépend que de word/header*.xml, rels, et word/media/*
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+    # XML compressé comme dans un vrai docx; PNG (déjà DEFLATE en interne) stocké tel quel
+    with zipfile.ZipFile(path, "w") as z:
         for name, data in files.items():
-            z.writestr(name, data)
+            zi = zipfile.ZipInfo(name)
+            zi.compress_type = zipfile.ZIP_STORED if name.endswith(".png") else zipfile.ZIP_DEFLATED
+            z.writestr(zi, data)
 
 
 def _read_zip_file(path: Path, name: str) -> bytes:
     with zipfile.ZipFile(path, "r") as z:
-        return z.read(name)
+        info = z.getinfo(name)
+        with z.open(info) as f:
+            return f.read(info.file_size)
 
 
 W_HDR_DRAWING = (
@@ -92,6 +130,15 @@ W_HDR_VML_CROPPED = W_HDR_VML.replace(
     "<v:imagedata r:id='rId5' o:title='{TAG}' croptop='1000f' cropleft='2000f' cropbottom='3000f' cropright='4000f'/>",
 )
 
+# En-têtes encodés une fois pour toutes (entrées fixes)
+HDR_DRAWING_LOGO = W_HDR_DRAWING.format(TAG="LOGO_HEADER").encode("utf-8")
+HDR_DRAWING_TITLE_LOGO = W_HDR_DRAWING_TITLE.format(TAG="LOGO_HEADER").encode("utf-8")
+HDR_DRAWING_LOGO_NEWLINE = W_HDR_DRAWING.format(TAG="LOGO_HEADER\n").encode("utf-8")
+HDR_VML_LOGO = W_HDR_VML.format(TAG="LOGO_HEADER").encode("utf-8")
+HDR_DRAWING_NOT_IT = W_HDR_DRAWING.format(TAG="NOT_IT").encode("utf-8")
+HDR_DRAWING_CROPPED_LOGO = W_HDR_DRAWING_CROPPED.format(TAG="LOGO_HEADER").encode("utf-8")
+HDR_VML_CROPPED_LOGO = W_HDR_VML_CROPPED.format(TAG="LOGO_HEADER").encode("utf-8")
+
 RELS_RID1 = (
     "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>"
     "<Relationships xmlns='http://schemas.openxmlformats.org/package/2006/relationships'>"
@@ -108,29 +155,43 @@ RELS_RID5 = (
 ).encode("utf-8")
 
 
-def test_update_docx_header_replaces_logo_by_descr(tmp_path: Path):
-    tpl = tmp_path / "tpl.docx"
+@pytest.fixture(scope="session")
+def template_docx(tmp_path_factory: pytest.TempPathFactory):
+    """Construit (une fois par session) le modèle docx d'une variante d'en-tête.
+
+    Les modèles sont partagés entre tests et ne doivent être ouverts qu'en lecture.
+    """
+    root = tmp_path_factory.mktemp("logo_templates")
+    built: dict[tuple[bytes, bytes], Path] = {}
+
+    def _get(header_xml: bytes, rels: bytes) -> Path:
+        key = (header_xml, rels)
+        if key not in built:
+            image_name = "word/media/image1.png" if rels is RELS_RID1 else "word/media/image5.png"
+            files = {
+                "word/header1.xml": header_xml,
+                "word/_rels/header1.xml.rels": rels,
+                image_name: _png_bytes((255, 0, 0, 255), (10, 10)),
+            }
+            if rels is RELS_RID1:
+                files["word/media/keep.png"] = _png_bytes((0, 0, 255, 255), (10, 10))
+            path = root / f"tpl{len(built)}.docx"
+            _make_docx(path, files)
+            built[key] = path
+        return built[key]
+
+    return _get
+
+
+def test_update_docx_header_replaces_logo_by_descr(tmp_path: Path, template_docx):
+    tpl = template_docx(HDR_DRAWING_LOGO, RELS_RID1)
     out = tmp_path / "out.docx"
 
     original = _png_bytes((255, 0, 0, 255), (10, 10))
     keep = _png_bytes((0, 0, 255, 255), (10, 10))
 
-    _make_docx(
-        tpl,
-        {
-            "word/header1.xml": W_HDR_DRAWING.format(TAG="LOGO_HEADER").encode("utf-8"),
-            "word/_rels/header1.xml.rels": RELS_RID1,
-            "word/media/image1.png": original,
-            "word/media/keep.png": keep,
-        },
-    )
-
     logo_path = tmp_path / "new_logo.png"
-    # logo avec "marges" (petit carré au centre)
-    with Image.new("RGBA", (80, 80), (0, 0, 0, 0)) as bg:
-        fg = Image.new("RGBA", (20, 20), (0, 255, 0, 255))
-        bg.paste(fg, (30, 30), fg)
-        bg.save(logo_path)
+    logo_path.write_bytes(_LOGO_PNG)
 
     update_docx_header(tpl, out, mapping={}, logo_path=logo_path)
 
@@ -142,10 +203,11 @@ def test_update_docx_header_replaces_logo_by_descr(tmp_path: Path):
     # géométrie inchangée: header1.xml pas modifié (pas de placeholders)
     assert _read_zip_file(out, "word/header1.xml") == _read_zip_file(tpl, "word/header1.xml")
 
-    # image valide
-    with Image.open(io.BytesIO(replaced)) as im:
-        assert im.size == (300, 150)  # 1in x 0.5in à 300 dpi
+    # image valide: taille lue directement dans l'IHDR (signature 8 o + longueur 4 o + "IHDR")
+    assert replaced[12:16] == b"IHDR"
+    assert struct.unpack(">II", replaced[16:24]) == (300, 150)  # 1in x 0.5in à 300 dpi
 
+    with Image.open(io.BytesIO(replaced)) as im:
         # V3: collé à gauche + centré verticalement
         bbox = _bbox_alpha(im)
         pad = round(min(im.size) * 0.08)
@@ -155,89 +217,41 @@ def test_update_docx_header_replaces_logo_by_descr(tmp_path: Path):
         assert abs(cy - (im.size[1] / 2.0)) <= 2.0
 
 
-def test_update_docx_header_replaces_logo_by_title(tmp_path: Path):
-    tpl = tmp_path / "tpl.docx"
-    out = tmp_path / "out.docx"
-
-    original = _png_bytes((255, 0, 0, 255), (10, 10))
-    _make_docx(
-        tpl,
-        {
-            "word/header1.xml": W_HDR_DRAWING_TITLE.format(TAG="LOGO_HEADER").encode("utf-8"),
-            "word/_rels/header1.xml.rels": RELS_RID1,
-            "word/media/image1.png": original,
-            "word/media/keep.png": _png_bytes((0, 0, 255, 255), (10, 10)),
-        },
-    )
-
-    logo_path = tmp_path / "new_logo.png"
-    logo_path.write_bytes(_png_bytes((0, 255, 0, 255), (50, 20)))
-
-    update_docx_header(tpl, out, mapping={}, logo_path=logo_path)
-    replaced = _read_zip_file(out, "word/media/image1.png")
-    assert replaced != original
-
-
-def test_update_docx_header_replaces_logo_with_trailing_newline(tmp_path: Path):
-    tpl = tmp_path / "tpl.docx"
-    out = tmp_path / "out.docx"
-
-    original = _png_bytes((255, 0, 0, 255), (10, 10))
-    _make_docx(
-        tpl,
-        {
-            # Word peut injecter un retour à la ligne dans descr (LOGO_HEADER\n)
-            "word/header1.xml": W_HDR_DRAWING.format(TAG="LOGO_HEADER\n").encode("utf-8"),
-            "word/_rels/header1.xml.rels": RELS_RID1,
-            "word/media/image1.png": original,
-            "word/media/keep.png": _png_bytes((0, 0, 255, 255), (10, 10)),
-        },
-    )
-
-    logo_path = tmp_path / "new_logo.png"
-    logo_path.write_bytes(_png_bytes((0, 255, 0, 255), (50, 20)))
-
-    update_docx_header(tpl, out, mapping={}, logo_path=logo_path)
-    replaced = _read_zip_file(out, "word/media/image1.png")
-    assert replaced != original
-
-
-def test_update_docx_header_replaces_logo_vml(tmp_path: Path):
-    tpl = tmp_path / "tpl.docx"
+@pytest.mark.parametrize(
+    "header_xml, rels, image_name, logo_size",
+    [
+        (HDR_DRAWING_TITLE_LOGO, RELS_RID1, "word/media/image1.png", (50, 20)),
+        # Word peut injecter un retour à la ligne dans descr (LOGO_HEADER\n)
+        (HDR_DRAWING_LOGO_NEWLINE, RELS_RID1, "word/media/image1.png", (50, 20)),
+        (HDR_VML_LOGO, RELS_RID5, "word/media/image5.png", (64, 64)),
+    ],
+    ids=["title", "trailing_newline", "vml"],
+)
+def test_update_docx_header_replaces_logo(
+    tmp_path: Path,
+    template_docx,
+    header_xml: bytes,
+    rels: bytes,
+    image_name: str,
+    logo_size: tuple[int, int],
+):
+    tpl = template_docx(header_xml, rels)
     out = tmp_path / "out.docx"
 
     original = _png_bytes((255, 0, 0, 255), (10, 10))
-    _make_docx(
-        tpl,
-        {
-            "word/header1.xml": W_HDR_VML.format(TAG="LOGO_HEADER").encode("utf-8"),
-            "word/_rels/header1.xml.rels": RELS_RID5,
-            "word/media/image5.png": original,
-        },
-    )
 
     logo_path = tmp_path / "new_logo.png"
-    logo_path.write_bytes(_png_bytes((0, 255, 0, 255), (64, 64)))
+    logo_path.write_bytes(_png_bytes((0, 255, 0, 255), logo_size))
 
     update_docx_header(tpl, out, mapping={}, logo_path=logo_path)
-    replaced = _read_zip_file(out, "word/media/image5.png")
+    replaced = _read_zip_file(out, image_name)
     assert replaced != original
 
 
-def test_update_docx_header_missing_placeholder_raises(tmp_path: Path):
-    tpl = tmp_path / "tpl.docx"
+def test_update_docx_header_missing_placeholder_raises(tmp_path: Path, template_docx):
+    tpl = template_docx(HDR_DRAWING_NOT_IT, RELS_RID1)
     out = tmp_path / "out.docx"
 
-    _make_docx(
-        tpl,
-        {
-            "word/header1.xml": W_HDR_DRAWING.format(TAG="NOT_IT").encode("utf-8"),
-            "word/_rels/header1.xml.rels": RELS_RID1,
-            "word/media/image1.png": _png_bytes((255, 0, 0, 255), (10, 10)),
-            "word/media/keep.png": _png_bytes((0, 0, 255, 255), (10, 10)),
-        },
-    )
-
     logo_path = tmp_path / "new_logo.png"
     logo_path.write_bytes(_png_bytes((0, 255, 0, 255), (50, 20)))
 
@@ -247,20 +261,11 @@ def test_update_docx_header_missing_placeholder_raises(tmp_path: Path):
     assert "LOGO_HEADER" in str(exc.value)
 
 
-def test_update_docx_header_strips_drawingml_crop_srcrect(tmp_path: Path):
-    tpl = tmp_path / "tpl.docx"
+def test_update_docx_header_strips_drawingml_crop_srcrect(tmp_path: Path, template_docx):
+    tpl = template_docx(HDR_DRAWING_CROPPED_LOGO, RELS_RID1)
     out = tmp_path / "out.docx"
 
     original = _png_bytes((255, 0, 0, 255), (10, 10))
-    _make_docx(
-        tpl,
-        {
-            "word/header1.xml": W_HDR_DRAWING_CROPPED.format(TAG="LOGO_HEADER").encode("utf-8"),
-            "word/_rels/header1.xml.rels": RELS_RID1,
-            "word/media/image1.png": original,
-            "word/media/keep.png": _png_bytes((0, 0, 255, 255), (10, 10)),
-        },
-    )
 
     logo_path = tmp_path / "new_logo.png"
     logo_path.write_bytes(_png_bytes((0, 255, 0, 255), (50, 20)))
@@ -275,13 +280,11 @@ def test_update_docx_header_strips_drawingml_crop_srcrect(tmp_path: Path):
     in_xml = _read_zip_file(tpl, "word/header1.xml")
     out_xml = _read_zip_file(out, "word/header1.xml")
 
-    in_root = ET.fromstring(in_xml)
-    out_root = ET.fromstring(out_xml)
+    in_root = ET.fromstring(in_xml, _PARSER)
+    out_root = ET.fromstring(out_xml, _PARSER)
 
     # plus de a:srcRect sur la drawing concernée
-    assert out_root.findall(".//a:srcRect", namespaces={
-        "a": "http://schemas.openxmlformats.org/drawingml/2006/main"
-    }) == []
+    assert next(out_root.iter("{http://schemas.openxmlformats.org/drawingml/2006/main}srcRect"), None) is None
 
     # extent inchangé
     ns = {
@@ -294,19 +297,11 @@ def test_update_docx_header_strips_drawingml_crop_srcrect(tmp_path: Path):
     assert in_extent.get("cy") == out_extent.get("cy")
 
 
-def test_update_docx_header_strips_vml_crop_attrs(tmp_path: Path):
-    tpl = tmp_path / "tpl.docx"
+def test_update_docx_header_strips_vml_crop_attrs(tmp_path: Path, template_docx):
+    tpl = template_docx(HDR_VML_CROPPED_LOGO, RELS_RID5)
     out = tmp_path / "out.docx"
 
     original = _png_bytes((255, 0, 0, 255), (10, 10))
-    _make_docx(
-        tpl,
-        {
-            "word/header1.xml": W_HDR_VML_CROPPED.format(TAG="LOGO_HEADER").encode("utf-8"),
-            "word/_rels/header1.xml.rels": RELS_RID5,
-            "word/media/image5.png": original,
-        },
-    )
 
     logo_path = tmp_path / "new_logo.png"
     logo_path.write_bytes(_png_bytes((0, 255, 0, 255), (64, 64)))
@@ -317,19 +312,18 @@ def test_update_docx_header_strips_vml_crop_attrs(tmp_path: Path):
     replaced = _read_zip_file(out, "word/media/image5.png")
     assert replaced != original
 
-    in_root = ET.fromstring(_read_zip_file(tpl, "word/header1.xml"))
-    out_root = ET.fromstring(_read_zip_file(out, "word/header1.xml"))
+    in_root = ET.fromstring(_read_zip_file(tpl, "word/header1.xml"), _PARSER)
+    out_root = ET.fromstring(_read_zip_file(out, "word/header1.xml"), _PARSER)
 
-    ns = {
-        "v": "urn:schemas-microsoft-com:vml",
-    }
-    in_shape = in_root.find(".//v:shape", namespaces=ns)
-    out_shape = out_root.find(".//v:shape", namespaces=ns)
+    v_shape = "{urn:schemas-microsoft-com:vml}shape"
+    v_imagedata = "{urn:schemas-microsoft-com:vml}imagedata"
+    in_shape = next(in_root.iter(v_shape), None)
+    out_shape = next(out_root.iter(v_shape), None)
     assert in_shape is not None and out_shape is not None
     assert (in_shape.get("style") or "") == (out_shape.get("style") or "")
 
-    in_img = in_root.find(".//v:imagedata", namespaces=ns)
-    out_img = out_root.find(".//v:imagedata", namespaces=ns)
+    in_img = next(in_root.iter(v_imagedata), None)
+    out_img = next(out_root.iter(v_imagedata), None)
     assert in_img is not None and out_img is not None
     assert "croptop" in in_img.attrib
     assert "cropleft" in in_img.attrib
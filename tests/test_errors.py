@@ -11,6 +11,19 @@ from core.errors import (
 )
 
 
+# Transformations partagées par les tests de chaînage (définies une seule fois)
+def _times_two(x: int) -> int:
+    return x * 2
+
+
+def _plus_ten_ok(x: int) -> Result[int]:
+    return Result.ok(x + 10)
+
+
+def _plus_five_ok(x: int) -> Result[int]:
+    return Result.ok(x + 5)
+
+
 class TestResultPattern:
     """Tests pour la classe Result[T]."""
 
@@ -54,7 +67,7 @@ class TestResultPattern:
     def test_map_transforms_success_value(self):
         """map() transforme la valeur si succès."""
         result = Result.ok(10)
-        mapped = result.map(lambda x: x * 2)
+        mapped = result.map(_times_two)
         assert mapped.success is True
         assert mapped.value == 20
 
@@ -62,14 +75,14 @@ class TestResultPattern:
         """map() préserve l'échec sans appliquer la fonction."""
         error = AppError("erreur")
         result: Result[int] = Result.fail(error)
-        mapped = result.map(lambda x: x * 2)
+        mapped = result.map(_times_two)
         assert mapped.success is False
         assert mapped.error == error
 
     def test_and_then_chains_successful_operations(self):
         """and_then() chaîne des opérations qui réussissent."""
         result = Result.ok(5)
-        chained = result.and_then(lambda x: Result.ok(x + 10))
+        chained = result.and_then(_plus_ten_ok)
         assert chained.success is True
         assert chained.value == 15
 
@@ -77,7 +90,7 @@ class TestResultPattern:
         """and_then() court-circuite si échec."""
         error = AppError("erreur initiale")
         result: Result[int] = Result.fail(error)
-        chained = result.and_then(lambda x: Result.ok(x + 10))
+        chained = result.and_then(_plus_ten_ok)
         assert chained.success is False
         assert chained.error == error
 
@@ -161,9 +174,9 @@ class TestResultChaining:
         """Chaînage complexe avec toutes les opérations qui réussissent."""
         result = (
             Result.ok(10)
-            .map(lambda x: x * 2)
-            .and_then(lambda x: Result.ok(x + 5))
-            .map(lambda x: str(x))
+            .map(_times_two)
+            .and_then(_plus_five_ok)
+            .map(str)
         )
         assert result.success is True
         assert result.value == "25"
@@ -173,9 +186,9 @@ class TestResultChaining:
         error = AppError("échec milieu")
         result = (
             Result.ok(10)
-            .map(lambda x: x * 2)
+            .map(_times_two)
             .and_then(lambda x: Result.fail(error))
-            .map(lambda x: str(x))  # Ne devrait jamais être appelé
+            .map(str)  # Ne devrait jamais être appelé
         )
         assert result.success is False
         assert result.error == error
@@ -1,61 +1,49 @@
 """Tests pour le module core/export.py."""
 
+import shutil
+
 import pytest
 from pathlib import Path
 from core.export import docx_to_pdf
 
+# docx_to_pdf passe par soffice: sans LibreOffice, inutile de construire les documents de test
+if shutil.which("soffice") is None:
+    pytest.skip("LibreOffice not available", allow_module_level=True)
+
 
 class TestDocxToPdf:
     """Tests pour la conversion DOCX vers PDF."""
 
-    def test_returns_path_object(self, tmp_path):
+    def test_returns_path_object(self, tmp_path, fresh_doc):
         """Retourne un objet Path."""
         # Créer un fichier DOCX de test
-        from docx import Document
-        
         docx_path = tmp_path / "test.docx"
-        doc = Document()
+        doc = fresh_doc
         doc.add_paragraph("Test")
         doc.save(docx_path)
         
-        # La conversion pourrait échouer sans LibreOffice installé
-        try:
-            result = docx_to_pdf(docx_path, tmp_path)
-            assert isinstance(result, Path)
-        except (RuntimeError, FileNotFoundError):
-            # LibreOffice non disponible, on skip ce test
-            pytest.skip("LibreOffice not available")
-
-    def test_creates_pdf_file(self, tmp_path):
+        result = docx_to_pdf(docx_path, tmp_path)
+        assert isinstance(result, Path)
+
+    def test_creates_pdf_file(self, tmp_path, fresh_doc):
         """Crée un fichier PDF."""
-        from docx import Document
-        
         docx_path = tmp_path / "document.docx"
-        doc = Document()
+        doc = fresh_doc
         doc.add_paragraph("Contenu du document")
         doc.save(docx_path)
         
-        try:
-            result = docx_to_pdf(docx_path, tmp_path)
-            # Vérifier que le fichier existe (si la conversion a réussi)
-            assert result.suffix == ".pdf"
-        except (RuntimeError, FileNotFoundError):
-            pytest.skip("LibreOffice not available")
-
-    def test_uses_output_dir(self, tmp_path):
+        result = docx_to_pdf(docx_path, tmp_path)
+        assert result.suffix == ".pdf"
+
+    def test_uses_output_dir(self, tmp_path, fresh_doc):
         """Utilise le répertoire de sortie spécifié."""
-        from docx import Document
-        
         docx_path = tmp_path / "input.docx"
         output_dir = tmp_path / "output"
         output_dir.mkdir()
         
-        doc = Document()
+        doc = fresh_doc
         doc.add_paragraph("Test")
         doc.save(docx_path)
         
-        try:
-            result = docx_to_pdf(docx_path, output_dir)
-            assert result.parent == output_dir
-        except (RuntimeError, FileNotFoundError):
-            pytest.skip("LibreOffice not available")
+        result = docx_to_pdf(docx_path, output_dir)
+        assert result.parent == output_dir
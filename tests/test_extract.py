@@ -1,8 +1,12 @@
 """Tests pour le module core/extract.py."""
 
+import os
 from pathlib import Path
 
-from core.extract import walk_files
+from docx import Document
+
+from core import extract as extract_mod
+from core.extract import extract_sources, walk_files
 
 
 class TestWalkFiles:
@@ -11,9 +15,9 @@ class TestWalkFiles:
     def test_finds_all_files(self, temp_client_dir: Path):
         """Trouve tous les fichiers dans un dossier."""
         files = walk_files(temp_client_dir)
+        names = {f.name for f in files}
         assert len(files) == 2
-        assert any(f.name == "cv.txt" for f in files)
-        assert any(f.name == "notes.txt" for f in files)
+        assert names == {"cv.txt", "notes.txt"}
 
     def test_excludes_hidden_files(self, tmp_path: Path):
         """Exclut les fichiers cachés."""
@@ -21,8 +25,7 @@ class TestWalkFiles:
         (tmp_path / "visible.txt").write_text("public")
 
         files = walk_files(tmp_path)
-        assert len(files) == 1
-        assert files[0].name == "visible.txt"
+        assert {f.name for f in files} == {"visible.txt"}
 
     def test_excludes_git_directory(self, tmp_path: Path):
         """Exclut le répertoire .git."""
@@ -32,5 +35,86 @@ class TestWalkFiles:
         (tmp_path / "file.txt").write_text("normal file")
 
         files = walk_files(tmp_path)
-        assert len(files) == 1
-        assert files[0].name == "file.txt"
+        assert {f.name for f in files} == {"file.txt"}
+
+
+class TestExtractCache:
+    """Tests pour le cache JSON des extractions (cache_dir)."""
+
+    def _client_dir(self, tmp_path: Path) -> Path:
+        client = tmp_path / "client"
+        client.mkdir()
+        doc = Document()
+        doc.add_paragraph("Contenu initial")
+        doc.save(client / "cv.docx")
+        return client
+
+    def test_reuses_cache_when_unchanged(self, tmp_path: Path, monkeypatch):
+        """Un second passage relit le cache sans reparser le DOCX."""
+        client = self._client_dir(tmp_path)
+        cache_dir = tmp_path / "cache"
+        first = extract_sources(client, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        def _boom(path):
+            raise AssertionError("extract_docx ne devait pas être appelé")
+
+        monkeypatch.setattr(extract_mod, "extract_docx", _boom)
+        second = extract_sources(client, cache_dir=cache_dir)
+        assert second["counts"]["ok"] == 1
+        assert second["documents"][0]["text"] == first["documents"][0]["text"]
+
+    def test_invalidated_when_file_changes(self, tmp_path: Path):
+        """Une modification (taille/mtime) du fichier force une nouvelle extraction."""
+        client = self._client_dir(tmp_path)
+        cache_dir = tmp_path / "cache"
+        extract_sources(client, cache_dir=cache_dir)
+
+        path = client / "cv.docx"
+        st = path.stat()
+        doc = Document()
+        doc.add_paragraph("Contenu modifié")
+        doc.save(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        payload = extract_sources(client, cache_dir=cache_dir)
+        assert "Contenu modifié" in payload["documents"][0]["text"]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path):
+        """Un cache illisible est ignoré puis réécrit."""
+        client = self._client_dir(tmp_path)
+        cache_dir = tmp_path / "cache"
+        extract_sources(client, cache_dir=cache_dir)
+        (cache_file,) = cache_dir.glob("*.json")
+        cache_file.write_text("{pas du json", encoding="utf-8")
+
+        payload = extract_sources(client, cache_dir=cache_dir)
+        assert "Contenu initial" in payload["documents"][0]["text"]
+        assert cache_file.read_text(encoding="utf-8").startswith("{\"path\"")
+
+    def test_one_stat_per_source(self, tmp_path: Path, monkeypatch):
+        """Clé du cache et métadonnées du document viennent du même stat."""
+        client = self._client_dir(tmp_path)
+        cache_dir = tmp_path / "cache"
+        extract_sources(client, cache_dir=cache_dir)
+
+        files = walk_files(client)
+        monkeypatch.setattr(extract_mod, "walk_files", lambda root: files)
+        calls = []
+        real_stat = Path.stat
+
+        def _spy(self, *args, **kwargs):
+            calls.append(self)
+            return real_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", _spy)
+        payload = extract_sources(client, cache_dir=cache_dir)
+        doc = payload["documents"][0]
+        assert calls.count(files[0]) == 1
+        assert doc["size_bytes"] == real_stat(files[0]).st_size
+
+    def test_no_cache_by_default(self, tmp_path: Path):
+        """Sans cache_dir, rien n'est écrit sur disque."""
+        client = self._client_dir(tmp_path)
+        extract_sources(client)
+        assert sorted(p.name for p in tmp_path.rglob("*")) == ["client", "cv.docx"]
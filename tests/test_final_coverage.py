@@ -2,30 +2,17 @@
 
 import pytest
 from pathlib import Path
-from core.extract import extract_pdf, extract_docx, extract_txt, walk_files
+from core.extract import extract_pdf_bytes, extract_docx, extract_txt, walk_files
 from core.context import normalize_text, chunk_text
 from core.generate import sanitize_output, truncate_lines, truncate_chars
-import fitz
-from docx import Document
 
 
 class TestFinalCoverageBoost:
     """Tests finaux pour atteindre 60%+."""
 
-    def test_extract_pdf_multiple_pages_detailed(self, tmp_path):
+    def test_extract_pdf_multiple_pages_detailed(self, sample_pdf_bytes):
         """Extraction PDF détaillée multipages."""
-        doc = fitz.open()
-        
-        # 3 pages
-        for i in range(3):
-            page = doc.new_page()
-            page.insert_text((50, 50 + i*20), f"Page {i+1}: Contenu de test")
-        
-        pdf_file = tmp_path / "detailed.pdf"
-        doc.save(pdf_file)
-        doc.close()
-        
-        result = extract_pdf(pdf_file)
+        result = extract_pdf_bytes(sample_pdf_bytes)
         
         assert result.success is True
         assert "Page 1" in result.value["text"]
@@ -34,25 +21,17 @@ class TestFinalCoverageBoost:
         assert "pages" in result.value
         assert len(result.value["pages"]) == 3
 
-    def test_extract_docx_complex_structure(self, tmp_path):
+    def test_extract_pdf_bytes_invalid_data_fails(self):
+        """Des octets non PDF donnent un échec explicite."""
+        result = extract_pdf_bytes(b"pas un pdf", name="faux.pdf")
+        
+        assert result.success is False
+        assert "faux.pdf" in str(result.error)
+
+    def test_extract_docx_complex_structure(self, tmp_path, sample_complex_docx_bytes):
         """DOCX avec structure complexe."""
         docx_file = tmp_path / "complex.docx"
-        doc = Document()
-        
-        # Plusieurs éléments
-        doc.add_heading("Titre Principal", level=1)
-        doc.add_paragraph("Paragraphe 1 avec du texte.")
-        doc.add_heading("Sous-titre", level=2)
-        doc.add_paragraph("Paragraphe 2 avec plus de contenu.")
-        
-        # Tableau
-        table = doc.add_table(rows=2, cols=2)
-        table.cell(0, 0).text = "A1"
-        table.cell(0, 1).text = "A2"
-        table.cell(1, 0).text = "B1"
-        table.cell(1, 1).text = "B2"
-        
-        doc.save(docx_file)
+        docx_file.write_bytes(sample_complex_docx_bytes)
         
         result = extract_docx(docx_file)
         
@@ -64,19 +43,17 @@ class TestFinalCoverageBoost:
         assert "A1" in result.value["text"]
         assert "B2" in result.value["text"]
 
-    def test_extract_txt_various_encodings(self, tmp_path):
+    @pytest.mark.parametrize("substring", ["éàü", "ñ", "€"], ids=["accents", "tilde", "euro"])
+    def test_extract_txt_various_encodings(self, tmp_path, sample_utf8_txt_bytes, substring):
         """Teste extraction avec différents contenus."""
         # UTF-8 avec caractères spéciaux
         txt_file = tmp_path / "utf8.txt"
-        content = "Texte avec éàü ñ ç œ\nLigne 2\nLigne 3 €£¥"
-        txt_file.write_text(content, encoding="utf-8")
+        txt_file.write_bytes(sample_utf8_txt_bytes)
         
         result = extract_txt(txt_file)
         
         assert result.success is True
-        assert "éàü" in result.value["text"]
-        assert "ñ" in result.value["text"]
-        assert "€" in result.value["text"]
+        assert substring in result.value["text"]
 
     def test_walk_files_recursive_structure(self, tmp_path):
         """walk_files avec structure récursive."""
@@ -94,52 +71,59 @@ class TestFinalCoverageBoost:
         assert len(result) == 3
         assert all(p.is_file() for p in result)
 
-    def test_normalize_text_comprehensive_cases(self):
-        """normalize_text - cas exhaustifs."""
-        cases = [
+    @pytest.mark.parametrize(
+        "input_val, expected_pattern",
+        [
             ("\r\n", "\n"),
             ("\r", "\n"),
             ("\n\n\n\n\n", "\n\n"),
             ("   text   ", "text"),
             ("line1\r\nline2\rline3\n", "line1\nline2\nline3"),
-        ]
-        for input_val, expected_pattern in cases:
-            result = normalize_text(input_val)
-            # Vérifier propriétés clés
-            assert "\r" not in result
-            if expected_pattern == "text":
-                assert result.strip() == "text"
+        ],
+        ids=["crlf", "cr", "many_newlines", "spaced", "mixed"],
+    )
+    def test_normalize_text_comprehensive_cases(self, input_val, expected_pattern):
+        """normalize_text - cas exhaustifs."""
+        result = normalize_text(input_val)
+        # Vérifier propriétés clés
+        assert "\r" not in result
+        if expected_pattern == "text":
+            assert result.strip() == "text"
 
-    def test_chunk_text_edge_cases(self):
+    @pytest.mark.parametrize(
+        "text, chunk_size, overlap, expected_min",
+        [
+            # Texte exactement à la taille du chunk
+            ("a" * 1000, 1000, 0, 1),
+            # Texte très court
+            ("court", 1000, 200, 1),
+            # Overlap important
+            ("mot " * 200, 500, 400, 1),
+        ],
+        ids=["exact_size", "short", "large_overlap"],
+    )
+    def test_chunk_text_edge_cases(self, text, chunk_size, overlap, expected_min):
         """chunk_text avec edge cases."""
-        # Texte exactement à la taille du chunk
-        text = "a" * 1000
-        result = chunk_text(text, chunk_size=1000, overlap=0)
-        assert len(result) >= 1
-        
-        # Texte très court
-        short = "court"
-        result = chunk_text(short, chunk_size=1000)
-        assert len(result) == 1
-        assert result[0] == short
-        
-        # Overlap important
-        text = "mot " * 200
-        result = chunk_text(text, chunk_size=500, overlap=400)
-        assert len(result) > 0
+        result = chunk_text(text, chunk_size=chunk_size, overlap=overlap)
+        assert len(result) >= expected_min
+        if len(text) < chunk_size:
+            assert result == [text]
 
-    def test_sanitize_output_all_cases(self):
-        """sanitize_output - tous les cas."""
-        cases = [
+    @pytest.mark.parametrize(
+        "input_val, expected_substring",
+        [
             ("```code```", "code"),
             ("text with \u200b zero-width", "text with   zero-width"),
             ("JSON: {}", "{}"),
             ("  spaced  ", "spaced"),
             ("json:\ndata", "data"),
-        ]
-        for input_val, expected_substring in cases:
-            result = sanitize_output(input_val)
-            assert expected_substring in result or result.strip()
+        ],
+        ids=["fence", "zero_width", "json_prefix", "spaced", "json_newline"],
+    )
+    def test_sanitize_output_all_cases(self, input_val, expected_substring):
+        """sanitize_output - tous les cas."""
+        result = sanitize_output(input_val)
+        assert expected_substring in result or result.strip()
 
     def test_truncate_comprehensive(self):
         """Tests exhaustifs de troncature."""
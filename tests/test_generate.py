@@ -1,5 +1,7 @@
 """Tests pour le module core/generate.py."""
 
+import pytest
+
 from core.generate import (
     looks_like_json_or_markdown,
     sanitize_output,
@@ -48,6 +50,22 @@ class TestLooksLikeJsonOrMarkdown:
         """Le texte brut n'est pas détecté comme JSON/Markdown."""
         assert looks_like_json_or_markdown('Simple text') is False
 
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Voici le JSON demandé", True),
+            ("format Json:", True),
+            ("jſon", True),  # s long: même repli de casse que la regex
+            ("jsonify est une fonction", False),
+            ("le fichier data.json", True),
+            ("  \n  {", True),
+            ("réponse: {}", False),
+        ],
+    )
+    def test_json_word_and_leading_brace(self, text, expected):
+        """Mot json isolé (toute casse) ou accolade/crochet en tête."""
+        assert looks_like_json_or_markdown(text) is expected
+
 
 class TestTruncateLines:
     """Tests pour la troncature par lignes."""
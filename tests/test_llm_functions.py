@@ -1,23 +1,36 @@
 """Tests pour les fonctions LLM de generate.py."""
 
 import pytest
-from unittest.mock import patch, Mock
+from dataclasses import dataclass
+from unittest.mock import patch
 from core.generate import check_llm_status, validate_allowed_value
 from core.errors import Result
 import json
 
 
+@dataclass
+class FakeResp:
+    """Réponse HTTP minimale pour urlopen (context manager + read)."""
+
+    body: bytes = b""
+
+    def __enter__(self) -> "FakeResp":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def read(self) -> bytes:
+        return self.body
+
+
 class TestCheckLlmStatus:
     """Tests pour check_llm_status."""
 
     @patch('core.generate.request.urlopen')
     def test_server_accessible(self, mock_urlopen):
         """Serveur accessible."""
-        mock_response = Mock()
-        mock_response.read.return_value = b'{"version": "2.0.0"}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        mock_urlopen.return_value = FakeResp(b'{"version": "2.0.0"}')
         
         result = check_llm_status("http://localhost:11434")
         assert result.success is True
@@ -36,17 +49,13 @@ class TestCheckLlmStatus:
     def test_model_available(self, mock_urlopen):
         """Modèle disponible."""
         def side_effect(url, timeout=None):
-            mock_response = Mock()
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            
             if "/api/version" in str(url):
-                mock_response.read.return_value = b'{"version": "1.0"}'
-            elif "/api/tags" in str(url):
-                mock_response.read.return_value = json.dumps({
+                return FakeResp(b'{"version": "1.0"}')
+            if "/api/tags" in str(url):
+                return FakeResp(json.dumps({
                     "models": [{"name": "llama2"}, {"name": "mistral"}]
-                }).encode()
-            return mock_response
+                }).encode())
+            return FakeResp()
         
         mock_urlopen.side_effect = side_effect
         
@@ -59,17 +68,13 @@ class TestCheckLlmStatus:
     def test_model_not_found(self, mock_urlopen):
         """Modèle introuvable."""
         def side_effect(url, timeout=None):
-            mock_response = Mock()
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            
             if "/api/version" in str(url):
-                mock_response.read.return_value = b'{"version": "1.0"}'
-            elif "/api/tags" in str(url):
-                mock_response.read.return_value = json.dumps({
+                return FakeResp(b'{"version": "1.0"}')
+            if "/api/tags" in str(url):
+                return FakeResp(json.dumps({
                     "models": [{"name": "llama2"}]
-                }).encode()
-            return mock_response
+                }).encode())
+            return FakeResp()
         
         mock_urlopen.side_effect = side_effect
         
@@ -1,22 +1,21 @@
 from __future__ import annotations
 
+import functools
 import io
 
-from PIL import Image, ImageChops  # type: ignore
+from PIL import Image, ImageDraw  # type: ignore
 
+from _imgutil import bbox as _bbox
 from core.logo_processing import LogoNormalizeConfig, normalize_logo_to_bytes
 
 
 def _bbox_alpha(im: Image.Image, *, alpha_threshold: int = 8) -> tuple[int, int, int, int]:
-    if im.mode != "RGBA":
-        im = im.convert("RGBA")
-    a = im.split()[-1]
-    mask = a.point(lambda x: 255 if x > alpha_threshold else 0)
-    bbox = mask.getbbox()
-    assert bbox is not None
-    return bbox
+    return _bbox(im, alpha_thr=alpha_threshold)
 
 
+# Les fixtures sont des fonctions pures de (taille, dessin): encodées une seule fois par session.
+# `draw` doit donc être une fonction de module (hashable et stable), pas une lambda locale.
+@functools.lru_cache(maxsize=None)
 def _make_png_rgba(size: tuple[int, int], *, draw: callable[[Image.Image], None]) -> bytes:
     im = Image.new("RGBA", size, (0, 0, 0, 0))
     draw(im)
@@ -25,20 +24,47 @@ def _make_png_rgba(size: tuple[int, int], *, draw: callable[[Image.Image], None]
     return buf.getvalue()
 
 
-def _make_jpg_rgb(size: tuple[int, int], *, draw: callable[[Image.Image], None], quality: int = 95) -> bytes:
+@functools.lru_cache(maxsize=None)
+def _make_jpg_rgb(size: tuple[int, int], *, draw: callable[[Image.Image], None], quality: int = 75) -> bytes:
     im = Image.new("RGB", size, (255, 255, 255))
     draw(im)
     buf = io.BytesIO()
-    im.save(buf, format="JPEG", quality=quality)
+    # Encodage baseline simple: pas de passe d'optimisation Huffman ni de mode progressif
+    im.save(buf, format="JPEG", quality=quality, optimize=False, progressive=False, subsampling=2)
     return buf.getvalue()
 
 
+def _draw_green_square(im: Image.Image) -> None:
+    im.paste(Image.new("RGBA", (120, 120), (0, 200, 0, 255)), (40, 40))
+
+
+def _draw_wide_red(im: Image.Image) -> None:
+    im.paste(Image.new("RGBA", (380, 80), (200, 0, 0, 255)), (10, 10))
+
+
+def _draw_dark_center(im: Image.Image) -> None:
+    im.paste(Image.new("RGB", (200, 100), (20, 20, 20)), (200, 100))
+
+
+def _draw_border(im: Image.Image) -> None:
+    # rectangle plein + bord 2px
+    w, h = im.size
+    fill = Image.new("RGBA", (w - 20, h - 20), (0, 120, 200, 255))
+    im.paste(fill, (10, 10), fill)
+    # bord jaune (4 bandes de 2px, remplies en C)
+    border = Image.new("RGBA", (w - 20, h - 20), (0, 0, 0, 0))
+    yellow = (255, 255, 0, 255)
+    d = ImageDraw.Draw(border)
+    d.rectangle([0, 0, w - 21, 1], fill=yellow)
+    d.rectangle([0, h - 22, w - 21, h - 21], fill=yellow)
+    d.rectangle([0, 0, 1, h - 21], fill=yellow)
+    d.rectangle([w - 22, 0, w - 21, h - 21], fill=yellow)
+    im.paste(border, (10, 10), border)
+
+
 def test_safe_contain_left_align_square_transparent():
     # Logo carré sur fond transparent
-    logo = _make_png_rgba(
-        (200, 200),
-        draw=lambda im: im.paste(Image.new("RGBA", (120, 120), (0, 200, 0, 255)), (40, 40)),
-    )
+    logo = _make_png_rgba((200, 200), draw=_draw_green_square)
 
     box_w, box_h = 400, 200
     cfg = LogoNormalizeConfig(padding_pct=0.08, background="transparent", dpi=300)
@@ -59,10 +85,7 @@ def test_safe_contain_left_align_square_transparent():
 
 def test_safe_contain_left_align_wide_logo_ratio_preserved():
     # Logo très large
-    logo = _make_png_rgba(
-        (400, 100),
-        draw=lambda im: im.paste(Image.new("RGBA", (380, 80), (200, 0, 0, 255)), (10, 10)),
-    )
+    logo = _make_png_rgba((400, 100), draw=_draw_wide_red)
 
     # Ratio attendu = ratio du contenu utile (après trim), pas du canvas initial.
     with Image.open(io.BytesIO(logo)) as src:
@@ -89,10 +112,7 @@ def test_safe_contain_left_align_wide_logo_ratio_preserved():
 
 def test_safe_trim_near_white_jpg_margins_get_removed():
     # JPEG avec grosses marges blanches : on dessine un rectangle sombre au centre.
-    logo = _make_jpg_rgb(
-        (600, 300),
-        draw=lambda im: im.paste(Image.new("RGB", (200, 100), (20, 20, 20)), (200, 100)),
-    )
+    logo = _make_jpg_rgb((600, 300), draw=_draw_dark_center)
 
     box_w, box_h = 600, 200
 
@@ -105,20 +125,9 @@ def test_safe_trim_near_white_jpg_margins_get_removed():
     out_no = normalize_logo_to_bytes(logo, target_w_px=box_w, target_h_px=box_h, output_ext=".png", cfg=cfg_no)
 
     with Image.open(io.BytesIO(out_trim)) as im_t, Image.open(io.BytesIO(out_no)) as im_n:
-        def bbox_dark(im: Image.Image) -> tuple[int, int, int, int]:
-            im = im.convert("RGBA")
-            r, g, b, a = im.split()
-            # Pixel considéré "contenu" si (alpha>8) ET (max(r,g,b)<200)
-            alpha_mask = a.point(lambda x: 255 if x > 8 else 0)
-            max_rgb = ImageChops.lighter(ImageChops.lighter(r, g), b)
-            dark_mask = max_rgb.point(lambda x: 255 if x < 200 else 0)
-            mask = ImageChops.multiply(alpha_mask, dark_mask)
-            bbox = mask.getbbox()
-            assert bbox is not None
-            return bbox
-
-        bt = bbox_dark(im_t)
-        bn = bbox_dark(im_n)
+        # Pixel considéré "contenu" si (alpha>8) ET (max(r,g,b)<200)
+        bt = _bbox(im_t, alpha_thr=8, dark_thr=200)
+        bn = _bbox(im_n, alpha_thr=8, dark_thr=200)
 
         wt = bt[2] - bt[0]
         wn = bn[2] - bn[0]
@@ -129,22 +138,7 @@ def test_safe_trim_near_white_jpg_margins_get_removed():
 
 def test_safe_no_crop_border_survives():
     # On dessine un cadre (border) pour détecter un éventuel crop.
-    def draw_border(im: Image.Image) -> None:
-        # rectangle plein + bord 2px
-        w, h = im.size
-        fill = Image.new("RGBA", (w - 20, h - 20), (0, 120, 200, 255))
-        im.paste(fill, (10, 10), fill)
-        # bord jaune
-        border = Image.new("RGBA", (w - 20, h - 20), (0, 0, 0, 0))
-        for x in range(w - 20):
-            for y in (0, 1, h - 21, h - 22):
-                border.putpixel((x, y), (255, 255, 0, 255))
-        for y in range(h - 20):
-            for x in (0, 1, w - 21, w - 22):
-                border.putpixel((x, y), (255, 255, 0, 255))
-        im.paste(border, (10, 10), border)
-
-    logo = _make_png_rgba((220, 120), draw=draw_border)
+    logo = _make_png_rgba((220, 120), draw=_draw_border)
 
     box_w, box_h = 500, 180
     cfg = LogoNormalizeConfig(padding_pct=0.08, background="transparent", dpi=300)
@@ -1,5 +1,8 @@
 """Tests massifs pour atteindre >60% de couverture."""
 
+import io
+from datetime import datetime
+
 import pytest
 from pathlib import Path
 from core.extract import extract_pdf, extract_docx, extract_txt, file_mtime_iso, sha256_text
@@ -7,39 +10,42 @@ from core.generate import truncate_lines, truncate_chars, sanitize_output
 from core.render import replace_text_everywhere, _stringify_answer
 from core.context import normalize_text, chunk_text, tokenize
 from docx import Document
-import fitz
+
+# Encodé une fois à l'import; extract_txt lit ce contenu au premier essai (UTF-8),
+# sans passer par le repli latin-1.
+ACCENTS_UTF8 = "àéèùôï français ñ español ü deutsch".encode("utf-8")
+
+# Corpus de chunking construits une fois à l'import
+_CHUNK_CORPUS = "mot " * 1000  # ~4000 caractères
+_CHUNK_LINES = "\n".join(f"Ligne {i}" for i in range(100))
+
+NORMALIZE_TEXT_CASES = [
+    pytest.param("a\r\nb\rc\n", "a\nb\nc", id="crlf_cr"),
+    pytest.param("\n\n\n\n", "", id="only_newlines"),
+    pytest.param("  text  ", "text", id="spaced"),
+    pytest.param("a\n\n\n\nb", "a\n\nb", id="many_newlines"),
+]
+
+TRUNCATE_LINES_CASES = [
+    pytest.param("single", 10, "single", id="single_line"),
+    pytest.param("a\nb\nc", 3, "a\nb\nc", id="exactly_max_lines"),
+]
 
 
 class TestExtractComprehensive:
     """Tests exhaustifs pour extract.py."""
 
-    def test_extract_pdf_with_multiple_pages(self, tmp_path):
+    def test_extract_pdf_with_multiple_pages(self, multipage_pdf):
         """Extrait un PDF multipages."""
-        doc = fitz.open()
-        p1 = doc.new_page()
-        p1.insert_text((50, 50), "Page 1 content")
-        p2 = doc.new_page()
-        p2.insert_text((50, 50), "Page 2 content")
-        
-        pdf_file = tmp_path / "multipage.pdf"
-        doc.save(pdf_file)
-        doc.close()
-        
-        result = extract_pdf(pdf_file)
+        result = extract_pdf(multipage_pdf)
         assert result.success is True
         assert "Page 1" in result.value["text"]
         assert "Page 2" in result.value["text"]
         assert "pages" in result.value
 
-    def test_extract_docx_with_multiple_paragraphs(self, tmp_path):
+    def test_extract_docx_with_multiple_paragraphs(self, multi_docx):
         """Extrait DOCX avec plusieurs paragraphes."""
-        docx_file = tmp_path / "multi.docx"
-        doc = Document()
-        for i in range(5):
-            doc.add_paragraph(f"Paragraphe {i}")
-        doc.save(docx_file)
-        
-        result = extract_docx(docx_file)
+        result = extract_docx(multi_docx)
         assert result.success is True
         for i in range(5):
             assert f"Paragraphe {i}" in result.value["text"]
@@ -47,8 +53,8 @@ class TestExtractComprehensive:
     def test_extract_txt_utf8_with_accents(self, tmp_path):
         """Extrait texte UTF-8 avec accents."""
         txt_file = tmp_path / "accents.txt"
-        content = "àéèùôï français ñ español ü deutsch"
-        txt_file.write_text(content, encoding="utf-8")
+        # Octets UTF-8 écrits tels quels: aucun encodage implicite de la plateforme en jeu
+        txt_file.write_bytes(ACCENTS_UTF8)
         
         result = extract_txt(txt_file)
         assert result.success is True
@@ -65,63 +71,59 @@ class TestExtractComprehensive:
         # Format ISO contient 'T' et peut-être 'Z' ou '+'
         assert "T" in result or "-" in result
 
+    def test_file_mtime_iso_uses_given_stat(self, tmp_path):
+        """Un stat fourni est utilisé tel quel, même si le fichier a disparu."""
+        test_file = tmp_path / "gone.txt"
+        test_file.write_text("data")
+        st = test_file.stat()
+        test_file.unlink()
+
+        assert file_mtime_iso(test_file) == ""
+        assert file_mtime_iso(test_file, st).startswith(str(datetime.fromtimestamp(st.st_mtime).year))
+
     def test_sha256_produces_64_char_hex(self):
         """SHA256 produit 64 caractères hex."""
         texts = ["a", "test", "long text " * 100, "éàü"]
         for text in texts:
             result = sha256_text(text)
             assert len(result) == 64
-            assert all(c in "0123456789abcdef" for c in result)
+            assert set(result) <= set("0123456789abcdef")
 
 
 class TestContextComprehensive:
     """Tests exhaustifs pour context.py."""
 
-    def test_normalize_text_comprehensive(self):
+    @pytest.mark.parametrize("input_val, expected", NORMALIZE_TEXT_CASES)
+    def test_normalize_text_comprehensive(self, input_val, expected):
         """Test exhaustif de normalize_text."""
-        cases = [
-            ("a\r\nb\rc\n", "a\nb\nc"),
-            ("\n\n\n\n", ""),
-            ("  text  ", "text"),
-            ("a\n\n\n\nb", "a\n\nb"),
-        ]
-        for input_val, expected in cases:
-            result = normalize_text(input_val)
-            # Vérifier les propriétés attendues
-            assert "\r" not in result
+        result = normalize_text(input_val)
+        assert result == expected
 
     def test_chunk_text_various_sizes(self):
         """Teste chunk_text avec différentes tailles."""
-        text = "mot " * 1000  # ~4000 caractères
-        
         # Petits chunks
-        result_small = chunk_text(text, chunk_size=500, overlap=50)
+        result_small = chunk_text(_CHUNK_CORPUS, chunk_size=500, overlap=50)
         assert len(result_small) > 1
         
         # Grands chunks
-        result_large = chunk_text(text, chunk_size=5000, overlap=100)
+        result_large = chunk_text(_CHUNK_CORPUS, chunk_size=5000, overlap=100)
         # Devrait avoir 1 chunk si le texte < 5000
         assert len(result_large) >= 1
 
     def test_chunk_text_with_newlines(self):
         """Teste chunking avec sauts de ligne."""
-        text = "\n".join([f"Ligne {i}" for i in range(100)])
-        result = chunk_text(text, chunk_size=200, overlap=20)
+        result = chunk_text(_CHUNK_LINES, chunk_size=200, overlap=20)
         assert len(result) > 0
-        assert all(isinstance(c, str) for c in result)
+        assert {type(c) for c in result} == {str}
 
     def test_tokenize_removes_common_stopwords(self):
         """Tokenize supprime les mots vides courants."""
         text = "le chat est dans la maison avec le chien"
-        result = tokenize(text, remove_stop=True)
+        tokens = set(tokenize(text, remove_stop=True))
         
-        # "le", "est", "dans", "la", "avec" doivent être supprimés
-        assert "chat" in result
-        assert "maison" in result
-        assert "chien" in result
+        assert {"chat", "maison", "chien"} <= tokens
         # Les mots vides ne doivent PAS être là
-        assert "le" not in result
-        assert "la" not in result
+        assert {"le", "la", "est", "dans", "avec"}.isdisjoint(tokens)
 
     def test_tokenize_preserves_all_with_flag_false(self):
         """Tokenize préserve tout si remove_stop=False."""
@@ -134,17 +136,10 @@ class TestContextComprehensive:
 class TestGenerateComprehensive:
     """Tests exhaustifs pour generate.py."""
 
-    def test_truncate_lines_edge_cases(self):
+    @pytest.mark.parametrize("text, max_lines, expected", TRUNCATE_LINES_CASES)
+    def test_truncate_lines_edge_cases(self, text, max_lines, expected):
         """Edge cases pour truncate_lines."""
-        # Une seule ligne
-        assert truncate_lines("single", 10) == "single"
-        
-        # Exactement max_lines
-        text = "a\nb\nc"
-        result = truncate_lines(text, 3)
-        assert "a" in result
-        assert "b" in result
-        assert "c" in result
+        assert truncate_lines(text, max_lines) == expected
 
     def test_truncate_chars_unicode(self):
         """Truncate avec Unicode."""
@@ -179,20 +174,10 @@ class TestRenderComprehensive:
         result = _stringify_answer(3.14159)
         assert "3.14" in result
 
-    def test_replace_text_in_tables(self, tmp_path):
+    def test_replace_text_in_tables(self, table_docx_bytes):
         """Remplace dans les tableaux."""
-        doc_path = tmp_path / "table.docx"
-        
-        doc = Document()
-        table = doc.add_table(rows=2, cols=2)
-        table.cell(0, 0).text = "{{HEADER1}}"
-        table.cell(0, 1).text = "{{HEADER2}}"
-        table.cell(1, 0).text = "{{DATA1}}"
-        table.cell(1, 1).text = "{{DATA2}}"
-        doc.save(doc_path)
-        
-        # Recharger le document sauvegardé
-        doc = Document(doc_path)
+        # Document frais rechargé depuis les octets partagés de la session
+        doc = Document(io.BytesIO(table_docx_bytes))
         mapping = {
             "{{HEADER1}}": "Col1",
             "{{HEADER2}}": "Col2",
@@ -202,11 +187,8 @@ class TestRenderComprehensive:
         replace_text_everywhere(doc, mapping)
         
         # Vérifier qu'au moins un remplacement a eu lieu
-        all_text = ""
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    all_text += cell.text
+        tables = doc.tables
+        all_text = "".join(cell.text for table in tables for row in table.rows for cell in row.cells)
         
         # Au moins une des valeurs devrait être présente
         assert "Col1" in all_text or "Val1" in all_text or len(all_text) > 0
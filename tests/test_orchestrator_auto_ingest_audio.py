@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
+import pytest
 
-def test_orchestrator_auto_ingest_audio_creates_transcripts(monkeypatch, tmp_path: Path):
+
+@pytest.fixture
+def fake_faster_whisper(monkeypatch):
+    """Module faster_whisper factice pour l'import de _audio_deps_ok().
+
+    monkeypatch restaure sys.modules en fin de test: le faux module ne fuit pas
+    vers les autres tests et le vrai (qui importe torch) n'est jamais chargé ici.
+    """
+
+    class _FakeFW:  # pragma: no cover
+        pass
+
+    monkeypatch.setitem(sys.modules, "faster_whisper", _FakeFW())
+
+
+def test_orchestrator_auto_ingest_audio_creates_transcripts(monkeypatch, tmp_path: Path, fake_faster_whisper):
     """Non-régression: un rapport ne doit pas exiger une ingestion manuelle.
 
     Si des audios existent et qu'aucun manifest n'existe encore dans
@@ -31,14 +48,6 @@ def test_orchestrator_auto_ingest_audio_creates_transcripts(monkeypatch, tmp_pat
     # Patch deps audio -> OK
     monkeypatch.setattr("backend.workers.orchestrator.shutil.which", lambda name: "/usr/bin/" + name)
 
-    # Patch import faster_whisper dans _audio_deps_ok(): on injecte un module factice
-    import sys
-
-    class _FakeFW:  # pragma: no cover
-        pass
-
-    sys.modules["faster_whisper"] = _FakeFW()  # type: ignore
-
     calls: list[dict[str, Any]] = []
 
     def fake_ingest_audio_file(audio_path_str: str, source_id: str, extra_metadata=None):
@@ -2,135 +2,78 @@
 Tests pour les profils de Production Gate (GO/NO-GO)
 """
 import pytest
-from pathlib import Path
-from unittest.mock import MagicMock
 
-from src.rhpro.normalizer import Normalizer
-from src.rhpro.ruleset_loader import load_ruleset
 from src.rhpro.segmenter import Segment
 
 
-# Chemins de base
-PROJECT_ROOT = Path(__file__).parent.parent
-RULESET_PATH = PROJECT_ROOT / 'config' / 'rulesets' / 'rhpro_v1.yaml'
+def _titled(raw_title: str, normalized_title: str) -> tuple[tuple[Segment, ...], tuple[dict, ...]]:
+    """Segment unique et section trouvée portant le même titre."""
+    return (
+        (Segment(raw_title=raw_title, normalized_title=normalized_title, level=1),),
+        ({'title': raw_title, 'section_id': 'test'},),
+    )
+
+
+STAGE = _titled("Bilan de stage", "bilan de stage")
+ORIENTATION_FORMATION_STAGE = _titled("Orientation formation stage", "orientation formation stage")
+SUIVI = _titled("Suivi du candidat", "suivi du candidat")
+PLACEMENT = _titled("Plan de placement", "plan de placement")
+LAI15 = _titled("Mesures LAI 15", "mesures lai 15")
+LAI18_DASH = _titled("Mesures LAI-18", "mesures lai-18")
+STAGE_UPPER = _titled("BILAN DE STAGE", "BILAN DE STAGE")
+STAGE_AND_SUIVI = _titled("Stage de suivi", "stage de suivi")
+
+# Segments/sections partagés en lecture seule (_choose_gate_profile ne les modifie pas)
+SEG_IDENTITE = Segment(raw_title="Identité", normalized_title="identité", level=1)
+SEG_CONCLUSION = Segment(raw_title="Conclusion", normalized_title="conclusion", level=1)
+SEG_TESTS = Segment(raw_title="Tests", normalized_title="tests", level=1)
+SEG_INCONNUE = Segment(raw_title="Section inconnue", normalized_title="section inconnue", level=1)
+SECTION_IDENTITY = {'title': 'Identité', 'section_id': 'identity'}
+SECTION_CONCLUSION = {'title': 'Conclusion', 'section_id': 'conclusion'}
+SECTION_TESTS = {'title': 'Tests', 'section_id': 'tests'}
+
+BILAN_COMPLET_SECTIONS = (
+    (),
+    (
+        SECTION_TESTS,
+        {'title': 'Profil emploi', 'section_id': 'profil_emploi'},
+    ),
+)
+
+# (segments + sections, profil attendu, signaux attendus)
+CHOOSE_PROFILE_CASES = [
+    pytest.param(STAGE, 'stage', {'has_stage': True}, id="stage_keyword"),
+    pytest.param(ORIENTATION_FORMATION_STAGE, 'stage', {'has_stage': True}, id="orientation_formation_stage"),
+    # Sans bilan_complet_sections ni LAI, c'est placement_suivi
+    pytest.param(SUIVI, 'placement_suivi', {}, id="placement_suivi_keyword_suivi"),
+    pytest.param(PLACEMENT, 'placement_suivi', {}, id="placement_suivi_keyword_placement"),
+    pytest.param(LAI15, 'placement_suivi', {'has_lai15': True}, id="placement_suivi_lai15"),
+    pytest.param(LAI18_DASH, 'placement_suivi', {'has_lai15': False, 'has_lai18': True}, id="placement_suivi_lai18_dash"),
+    # >= 2 sections bilan complet
+    pytest.param(BILAN_COMPLET_SECTIONS, 'bilan_complet', {'bilan_complet_sections_count': 2}, id="bilan_complet_with_tests"),
+    pytest.param(STAGE_UPPER, 'stage', {}, id="case_insensitive"),
+    # "stage" et "suivi" présents: stage gagne au scoring
+    pytest.param(STAGE_AND_SUIVI, 'stage', {}, id="stage_priority_over_suivi"),
+]
 
 
 class TestGateProfileSelection:
     """Tests pour la sélection automatique du profil"""
     
-    @pytest.fixture
-    def normalizer(self):
-        """Fixture pour créer un normalizer avec le ruleset"""
-        ruleset = load_ruleset(str(RULESET_PATH))
-        return Normalizer(ruleset)
-    
-    def test_choose_profile_stage_keyword(self, normalizer):
-        """Doit sélectionner 'stage' si mot-clé 'stage' dans les titres"""
-        # Créer des segments avec un titre contenant "stage"
-        segments = [
-            Segment(raw_title="Bilan de stage", normalized_title="bilan de stage", level=1)
-        ]
-        found_sections = [{'title': 'Bilan de stage', 'section_id': 'test'}]
-        
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
-        
-        assert profile_id == 'stage'
-        assert signals['has_stage'] is True
-    
-    def test_choose_profile_stage_orientation_formation_stage(self, normalizer):
-        """Doit sélectionner 'stage' si titre contient 'orientation formation stage'"""
-        segments = [
-            Segment(raw_title="Orientation formation stage", normalized_title="orientation formation stage", level=1)
-        ]
-        found_sections = [{'title': 'Orientation formation stage', 'section_id': 'test'}]
-        
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
-        
-        assert profile_id == 'stage'
-        assert signals['has_stage'] is True
-    
-    def test_choose_profile_placement_suivi_keyword_suivi(self, normalizer):
-        """Doit sélectionner 'placement_suivi' par défaut si pas de signaux spécifiques"""
-        segments = [
-            Segment(raw_title="Suivi du candidat", normalized_title="suivi du candidat", level=1)
-        ]
-        found_sections = [{'title': 'Suivi du candidat', 'section_id': 'test'}]
-        
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
-        
-        # Sans bilan_complet_sections ni LAI, c'est placement_suivi
-        assert profile_id == 'placement_suivi'
-    
-    def test_choose_profile_placement_suivi_keyword_placement(self, normalizer):
-        """Doit sélectionner 'placement_suivi' par défaut"""
-        segments = [
-            Segment(raw_title="Plan de placement", normalized_title="plan de placement", level=1)
-        ]
-        found_sections = [{'title': 'Plan de placement', 'section_id': 'test'}]
-        
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
-        
-        assert profile_id == 'placement_suivi'
-    
-    def test_choose_profile_placement_suivi_lai15(self, normalizer):
-        """Doit sélectionner 'placement_suivi' si LAI 15 détecté"""
-        segments = [
-            Segment(raw_title="Mesures LAI 15", normalized_title="mesures lai 15", level=1)
-        ]
-        found_sections = [{'title': 'Mesures LAI 15', 'section_id': 'test'}]
-        
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
-        
-        assert profile_id == 'placement_suivi'
-        assert signals['has_lai15'] is True
-    
-    def test_choose_profile_bilan_complet_with_tests(self, normalizer):
-        """Doit sélectionner 'bilan_complet' si >= 2 sections bilan complet"""
-        segments = []
-        found_sections = [
-            {'title': 'Tests', 'section_id': 'tests'},
-            {'title': 'Profil emploi', 'section_id': 'profil_emploi'}
-        ]
-        
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
-        
-        assert profile_id == 'bilan_complet'
-        assert signals['bilan_complet_sections_count'] >= 2
-    
-    def test_choose_profile_case_insensitive(self, normalizer):
-        """La détection doit être insensible à la casse"""
-        segments = [
-            Segment(raw_title="BILAN DE STAGE", normalized_title="BILAN DE STAGE", level=1)
-        ]
-        found_sections = [{'title': 'BILAN DE STAGE', 'section_id': 'test'}]
-        
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
-        
-        assert profile_id == 'stage'
-    
-    def test_choose_profile_stage_priority_over_suivi(self, normalizer):
-        """'stage' doit avoir un meilleur score que les autres profils"""
-        # Si on a à la fois "stage" et "suivi", "stage" doit gagner via scoring
-        segments = [
-            Segment(raw_title="Stage de suivi", normalized_title="stage de suivi", level=1)
-        ]
-        found_sections = [{'title': 'Stage de suivi', 'section_id': 'test'}]
+    @pytest.mark.parametrize("case, expected_profile, expected_signals", CHOOSE_PROFILE_CASES)
+    def test_choose_profile(self, normalizer, case, expected_profile, expected_signals):
+        """Le profil et les signaux dépendent des titres détectés"""
+        segments, found_sections = case
         
-        profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
+        profile_id, signals = normalizer._choose_gate_profile(list(segments), list(found_sections))
         
-        # Stage doit être détecté car il est testé en premier
-        assert profile_id == 'stage'
+        assert profile_id == expected_profile
+        assert {k: signals[k] for k in expected_signals} == expected_signals
 
 
 class TestGateProfileEvaluation:
     """Tests pour l'évaluation GO/NO-GO selon le profil"""
     
-    @pytest.fixture
-    def normalizer(self):
-        """Fixture pour créer un normalizer avec le ruleset"""
-        ruleset = load_ruleset(str(RULESET_PATH))
-        return Normalizer(ruleset)
-    
     def test_evaluate_bilan_complet_strict(self, normalizer):
         """Profil bilan_complet: critères stricts"""
         # Cas NO-GO : coverage trop faible
@@ -274,11 +217,9 @@ class TestGateProfileEvaluation:
 class TestGateProfileIntegration:
     """Tests d'intégration pour le système de profils"""
     
-    def test_profile_override_works(self):
+    @pytest.mark.slow
+    def test_profile_override_works(self, normalizer):
         """L'override manuel du profil doit fonctionner"""
-        ruleset = load_ruleset(str(RULESET_PATH))
-        normalizer = Normalizer(ruleset)
-        
         # Créer des segments qui devraient normalement déclencher "stage"
         segments = [
             Segment(raw_title="Bilan de stage", normalized_title="bilan de stage", 
@@ -292,11 +233,9 @@ class TestGateProfileIntegration:
         assert gate['profile'] == 'bilan_complet'
         assert gate['signals'].get('forced') is True
     
-    def test_auto_detection_without_override(self):
+    @pytest.mark.slow
+    def test_auto_detection_without_override(self, normalizer):
         """Sans override, l'auto-détection doit fonctionner"""
-        ruleset = load_ruleset(str(RULESET_PATH))
-        normalizer = Normalizer(ruleset)
-        
         segments = [
             Segment(raw_title="Plan de placement", normalized_title="plan de placement", 
                    level=1, mapped_section_id='identity')
@@ -312,25 +251,13 @@ class TestGateProfileIntegration:
 class TestGateProfileScoring:
     """Tests pour le système de scoring durci"""
     
-    @pytest.fixture
-    def normalizer(self):
-        """Fixture pour créer un normalizer avec le ruleset"""
-        ruleset = load_ruleset(str(RULESET_PATH))
-        return Normalizer(ruleset)
-    
     def test_false_positive_stage_in_content_not_title(self, normalizer):
         """Faux positif: 'stage' dans contenu mais pas dans les titres
         Le système durci NE doit PAS détecter 'stage' car absent des headings"""
         # Segments sans "stage" dans les titres
-        segments = [
-            Segment(raw_title="Identité", normalized_title="identité", level=1),
-            Segment(raw_title="Conclusion", normalized_title="conclusion", level=1)
-        ]
+        segments = [SEG_IDENTITE, SEG_CONCLUSION]
         # Section_ids normaux (pas de stage)
-        found_sections = [
-            {'title': 'Identité', 'section_id': 'identity'},
-            {'title': 'Conclusion', 'section_id': 'conclusion'}
-        ]
+        found_sections = [SECTION_IDENTITY, SECTION_CONCLUSION]
         
         # Le contenu des paragraphes pourrait contenir "stage" mais on l'ignore
         profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
@@ -344,14 +271,8 @@ class TestGateProfileScoring:
         """Cas ambigu: document avec quelques signaux mixtes
         Le scoring doit trancher de manière déterministe"""
         # Document avec 1 section bilan_complet mais aussi du contenu léger
-        segments = [
-            Segment(raw_title="Identité", normalized_title="identité", level=1),
-            Segment(raw_title="Tests", normalized_title="tests", level=1)
-        ]
-        found_sections = [
-            {'title': 'Identité', 'section_id': 'identity'},
-            {'title': 'Tests', 'section_id': 'tests'}
-        ]
+        segments = [SEG_IDENTITE, SEG_TESTS]
+        found_sections = [SECTION_IDENTITY, SECTION_TESTS]
         
         profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
         
@@ -371,9 +292,7 @@ class TestGateProfileScoring:
     
     def test_high_confidence_stage_detection(self, normalizer):
         """Signal fort 'stage' doit donner une haute confidence"""
-        segments = [
-            Segment(raw_title="Bilan de stage", normalized_title="bilan de stage", level=1)
-        ]
+        segments = list(STAGE[0])
         found_sections = [
             {'title': 'Bilan de stage', 'section_id': 'orientation_formation.stage'}
         ]
@@ -412,9 +331,7 @@ class TestGateProfileScoring:
     def test_scoring_all_zeros_fallback_to_default(self, normalizer):
         """Si tous les scores sont nuls, fallback sur le profil par défaut"""
         # Document minimal sans aucun signal
-        segments = [
-            Segment(raw_title="Section inconnue", normalized_title="section inconnue", level=1)
-        ]
+        segments = [SEG_INCONNUE]
         found_sections = []
         
         profile_id, signals = normalizer._choose_gate_profile(segments, found_sections)
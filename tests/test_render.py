@@ -6,9 +6,9 @@ from core.render import (
     _norm,
     build_moustache_mapping,
     _stringify_answer,
+    replace_section,
     replace_text_everywhere
 )
-from docx import Document
 
 
 class TestNormFunction:
@@ -54,8 +54,20 @@ class TestStringifyAnswer:
     def test_converts_list_to_bullets(self):
         """Convertit une liste en points."""
         result = _stringify_answer(["item1", "item2"])
-        assert "item1" in result
-        assert "item2" in result
+        assert result == "- item1\n- item2"
+
+    def test_list_skips_empty_items(self):
+        """Les éléments vides ne produisent pas de puce."""
+        assert _stringify_answer([" a ", None, "", 3]) == "- a\n- 3"
+
+    def test_nested_list_is_flattened(self):
+        """Une liste imbriquée donne une puce par élément, sans puce doublée."""
+        assert _stringify_answer(["a", ["b", ("c",)], "d"]) == "- a\n- b\n- c\n- d"
+
+    def test_multiline_item_bullets_every_line(self):
+        """Chaque ligne d'un élément multi-lignes (str ou dict value) reçoit sa puce."""
+        result = _stringify_answer(["un\ndeux", {"value": "trois\n\n quatre "}])
+        assert result == "- un\n- deux\n- trois\n- quatre"
 
     def test_handles_none(self):
         """Gère None."""
@@ -90,35 +102,52 @@ class TestBuildMoustacheMapping:
 class TestReplaceTextEverywhere:
     """Tests pour le remplacement de texte dans un document."""
 
-    def test_replaces_in_paragraphs(self, tmp_path):
+    def test_replaces_in_paragraphs(self, fresh_doc):
         """Remplace dans les paragraphes."""
-        doc_path = tmp_path / "test.docx"
-        
-        doc = Document()
+        doc = fresh_doc
         doc.add_paragraph("Bonjour {{NOM}}")
-        doc.save(doc_path)
         
-        doc = Document(doc_path)
         replace_text_everywhere(doc, {"{{NOM}}": "MARTIN"})
         
-        text = "\n".join([p.text for p in doc.paragraphs])
+        text = "\n".join(p.text for p in doc.paragraphs)
         assert "MARTIN" in text
         assert "{{NOM}}" not in text
 
-    def test_replaces_multiple_placeholders(self, tmp_path):
+    def test_replaces_multiple_placeholders(self, fresh_doc):
         """Remplace plusieurs placeholders."""
-        doc_path = tmp_path / "test.docx"
-        
-        doc = Document()
+        doc = fresh_doc
         doc.add_paragraph("{{NOM}} {{PRÉNOM}}")
-        doc.save(doc_path)
         
-        doc = Document(doc_path)
         replace_text_everywhere(doc, {
             "{{NOM}}": "DUPONT",
             "{{PRÉNOM}}": "Marie"
         })
         
-        text = "\n".join([p.text for p in doc.paragraphs])
+        text = "\n".join(p.text for p in doc.paragraphs)
         assert "DUPONT" in text
         assert "Marie" in text
+
+
+class TestReplaceSection:
+    """Tests pour le remplacement d'une section."""
+
+    def test_every_inserted_line_keeps_base_style(self, fresh_doc):
+        """Chaque ligne insérée reprend le style du contenu remplacé."""
+        doc = fresh_doc
+        doc.add_paragraph("Conclusion", style="Heading 1")
+        doc.add_paragraph("ancien contenu", style="List Bullet")
+        doc.add_paragraph("Fin", style="Heading 1")
+
+        replace_section(
+            doc,
+            start_text="Conclusion",
+            end_text="Fin",
+            answer_text="- un\n\n* deux\ntrois",
+            start_style_prefixes=["Heading"],
+            end_style_prefixes=["Heading"],
+        )
+
+        body = doc.paragraphs[1:-1]
+        assert [p.text for p in body] == ["• un", "• deux", "trois"]
+        assert {p.style.name for p in body} == {"List Bullet"}
+        assert doc.paragraphs[-1].text == "Fin"
@@ -8,7 +8,6 @@ from core.render import (
     build_moustache_mapping,
     replace_text_everywhere
 )
-from docx import Document
 
 
 class TestRenderHelpers:
@@ -68,37 +67,56 @@ class TestRenderHelpers:
         for val in result.values():
             assert isinstance(val, str)
 
-    def test_replace_text_in_multiple_paragraphs(self, tmp_path):
+    def test_replace_text_in_multiple_paragraphs(self, fresh_doc):
         """Remplace dans plusieurs paragraphes."""
-        doc_path = tmp_path / "multi.docx"
-        
-        doc = Document()
+        doc = fresh_doc
         doc.add_paragraph("Premier {{NOM}}")
         doc.add_paragraph("Deuxième {{PRÉNOM}}")
         doc.add_paragraph("Troisième {{NOM}} encore")
-        doc.save(doc_path)
         
-        doc = Document(doc_path)
         replace_text_everywhere(doc, {
             "{{NOM}}": "MARTIN",
             "{{PRÉNOM}}": "Sophie"
         })
         
-        all_text = "\n".join([p.text for p in doc.paragraphs])
+        all_text = "\n".join(p.text for p in doc.paragraphs)
         assert "MARTIN" in all_text
         assert "Sophie" in all_text
         assert "{{NOM}}" not in all_text
         assert "{{PRÉNOM}}" not in all_text
 
-    def test_replace_text_handles_empty_mapping(self, tmp_path):
-        """Gère un mapping vide."""
-        doc_path = tmp_path / "empty_map.docx"
+    def test_replace_text_prefers_longest_token(self, fresh_doc):
+        """À même position, le token le plus long l'emporte ({{NOM}} avant {NOM})."""
+        doc = fresh_doc
+        doc.add_paragraph("{{NOM}} / {NOM}")
+        
+        replace_text_everywhere(doc, {"{NOM}": "court", "{{NOM}}": "long"})
+        
+        assert doc.paragraphs[0].text == "long / court"
+
+    def test_replace_text_does_not_rescan_inserted_values(self, fresh_doc):
+        """Une valeur qui contient un autre token est insérée telle quelle (une seule passe)."""
+        doc = fresh_doc
+        doc.add_paragraph("Bonjour {{PRENOM}}")
+        
+        replace_text_everywhere(doc, {"{{PRENOM}}": "Sophie {{NOM}}", "{{NOM}}": "Martin"})
         
-        doc = Document()
+        assert doc.paragraphs[0].text == "Bonjour Sophie {{NOM}}"
+
+    def test_replace_text_overlapping_tokens_leftmost_wins(self, fresh_doc):
+        """Deux tokens qui se chevauchent: l'occurrence la plus à gauche est remplacée."""
+        doc = fresh_doc
+        doc.add_paragraph("NOM_PRENOM")
+        
+        replace_text_everywhere(doc, {"NOM_P": "x", "PRENOM": "y"})
+        
+        assert doc.paragraphs[0].text == "xRENOM"
+
+    def test_replace_text_handles_empty_mapping(self, fresh_doc):
+        """Gère un mapping vide."""
+        doc = fresh_doc
         doc.add_paragraph("Texte {{PLACEHOLDER}}")
-        doc.save(doc_path)
         
-        doc = Document(doc_path)
         replace_text_everywhere(doc, {})
         
         # Le texte ne devrait pas changer
@@ -1,49 +1,112 @@
 """
 Tests pour le module RH-Pro parsing
 """
+import json
+import os
+import shutil
+
 import pytest
-from pathlib import Path
+from _samples import find_sample_docx
 
-from src.rhpro.parse_bilan import parse_bilan_docx_to_normalized
-from src.rhpro.ruleset_loader import load_ruleset
+from src.rhpro import ruleset_loader
+from src.rhpro.ruleset_loader import RulesetLoader, load_ruleset
 
 
-# Chemins de base
-PROJECT_ROOT = Path(__file__).parent.parent
-RULESET_PATH = PROJECT_ROOT / 'config' / 'rulesets' / 'rhpro_v1.yaml'
+SAMPLE_DOCX_PATH = find_sample_docx()
 
-# Chercher automatiquement le premier source.docx
-def _find_sample_docx():
-    """Trouve le premier source.docx dans data/samples/*/"""
-    samples_dir = PROJECT_ROOT / 'data' / 'samples'
-    if not samples_dir.exists():
-        return None
-    source_files = sorted(samples_dir.glob('**/source.docx'))
-    return source_files[0] if source_files else None
 
-SAMPLE_DOCX_PATH = _find_sample_docx()
+@pytest.fixture(scope="module")
+def parse_fn():
+    """Import différé: la collecte ne paie pas la chaîne docx/lxml de parse_bilan"""
+    from src.rhpro.parse_bilan import parse_bilan_docx_to_normalized
+    return parse_bilan_docx_to_normalized
 
 
 class TestRulesetLoader:
     """Tests pour le chargement du ruleset"""
     
-    def test_ruleset_exists(self):
+    def test_ruleset_exists(self, ruleset_path):
         """Vérifie que le ruleset existe"""
-        assert RULESET_PATH.exists(), f"Ruleset not found at {RULESET_PATH}"
+        assert ruleset_path.exists(), f"Ruleset not found at {ruleset_path}"
     
-    def test_load_ruleset(self):
+    def test_load_ruleset(self, ruleset_path):
         """Vérifie que le ruleset se charge correctement"""
-        ruleset = load_ruleset(str(RULESET_PATH))
+        ruleset = load_ruleset(str(ruleset_path))
         
         assert ruleset.version == "rhpro-v1"
         assert ruleset.language == "fr"
         assert ruleset.doc_type == "bilan_orientation_rhpro"
         assert len(ruleset.sections) > 0
     
-    def test_ruleset_sections_structure(self):
-        """Vérifie la structure des sections"""
-        ruleset = load_ruleset(str(RULESET_PATH))
+    def test_load_ruleset_is_cached_until_file_changes(self, ruleset_path, tmp_path, monkeypatch):
+        """Le YAML n'est reparsé que si sa taille ou son mtime change"""
+        local = tmp_path / "rhpro.yaml"
+        shutil.copyfile(ruleset_path, local)
+        calls = []
+        real_load = ruleset_loader.yaml.load
+        monkeypatch.setattr(ruleset_loader.yaml, "load", lambda *a, **kw: calls.append(1) or real_load(*a, **kw))
+        
+        first = load_ruleset(str(local))
+        load_ruleset(str(local))
+        assert len(calls) == 1
+        
+        st = local.stat()
+        os.utime(local, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_ruleset(str(local)).version == first.version
+        assert len(calls) == 2
+        
+        # Même mtime mais contenu différent (mtime grossier, restauration): la taille invalide
+        st = local.stat()
+        local.write_bytes(local.read_bytes().replace(b"rhpro-v1", b"rhpro-v1-bis", 1))
+        os.utime(local, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert load_ruleset(str(local)).version == "rhpro-v1-bis"
+    
+    def test_load_ruleset_callers_do_not_share_state(self, ruleset_path):
+        """Modifier le ruleset reçu n'affecte pas les appels suivants"""
+        first = load_ruleset(str(ruleset_path))
+        first.raw_data["version"] = "modifie"
+        first.sections.clear()
+        
+        second = load_ruleset(str(ruleset_path))
+        assert second.version == "rhpro-v1"
+        assert len(second.sections) > 0
+    
+    def test_ruleset_json_cache_written_and_invalidated(self, ruleset_path, tmp_path):
+        """Le cache JSON sert tant que taille et mtime du YAML sont inchangés"""
+        local = tmp_path / "rhpro.yaml"
+        shutil.copyfile(ruleset_path, local)
+        cache_dir = tmp_path / "cache"
         
+        RulesetLoader(str(local), cache_dir=cache_dir)
+        (cache,) = cache_dir.glob("*.json")
+        data = json.loads(cache.read_text(encoding="utf-8"))
+        assert data["data"]["version"] == "rhpro-v1"
+        
+        data["data"]["version"] = "depuis-cache"
+        cache.write_text(json.dumps(data), encoding="utf-8")
+        assert RulesetLoader(str(local), cache_dir=cache_dir).version == "depuis-cache"
+        
+        # YAML restauré avec un mtime conservé (git checkout, rsync -t): la taille suffit à invalider
+        st = local.stat()
+        local.write_bytes(local.read_bytes() + b"\n# commentaire\n")
+        os.utime(local, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert RulesetLoader(str(local), cache_dir=cache_dir).version == "rhpro-v1"
+    
+    def test_ruleset_json_cache_is_opt_in(self, ruleset_path, tmp_path):
+        """Sans cache_dir, rien n'est écrit à côté du YAML"""
+        local = tmp_path / "rhpro.yaml"
+        shutil.copyfile(ruleset_path, local)
+        
+        RulesetLoader(str(local))
+        assert [p.name for p in tmp_path.iterdir()] == ["rhpro.yaml"]
+    
+    def test_load_ruleset_missing_file_raises(self, tmp_path):
+        """Un chemin inexistant lève FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            load_ruleset(str(tmp_path / "absent.yaml"))
+    
+    def test_ruleset_sections_structure(self, ruleset):
+        """Vérifie la structure des sections"""
         # Vérifier quelques sections clés
         identity = ruleset.get_section_by_id('identity')
         assert identity is not None
@@ -55,16 +118,13 @@ class TestRulesetLoader:
         assert profession['label'] == "Profession"
 
 
-@pytest.mark.skipif(not SAMPLE_DOCX_PATH.exists(), reason="Sample DOCX not available")
+@pytest.mark.skipif(SAMPLE_DOCX_PATH is None, reason="Sample DOCX not available")
 class TestParseBilan:
     """Tests pour le parsing complet"""
     
-    def test_parse_bilan_basic(self):
+    def test_parse_bilan_basic(self, parsed_bilan):
         """Test basique: le parsing retourne une structure valide"""
-        result = parse_bilan_docx_to_normalized(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         # Vérifier les clés principales
         assert 'normalized' in result
@@ -91,12 +151,9 @@ class TestParseBilan:
         assert isinstance(report['unknown_titles'], list)
         assert isinstance(report['warnings'], list)
     
-    def test_no_invented_content_for_source_only(self):
+    def test_no_invented_content_for_source_only(self, parsed_bilan):
         """Vérifie qu'on n'invente pas de contenu pour les champs source_only"""
-        result = parse_bilan_docx_to_normalized(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         normalized = result['normalized']
         
@@ -114,20 +171,20 @@ class TestParseBilan:
 class TestParseWithoutSample:
     """Tests qui ne nécessitent pas de sample DOCX"""
     
-    def test_parse_missing_docx(self):
+    def test_parse_missing_docx(self, parse_fn, ruleset_path):
         """Test avec un fichier DOCX inexistant"""
         with pytest.raises(FileNotFoundError):
-            parse_bilan_docx_to_normalized(
+            parse_fn(
                 'nonexistent.docx',
-                str(RULESET_PATH)
+                str(ruleset_path)
             )
     
-    def test_parse_missing_ruleset(self):
+    def test_parse_missing_ruleset(self, parse_fn):
         """Test avec un ruleset inexistant"""
         # Créer un DOCX temporaire vide si besoin
         with pytest.raises(FileNotFoundError):
-            parse_bilan_docx_to_normalized(
-                str(SAMPLE_DOCX_PATH) if SAMPLE_DOCX_PATH.exists() else 'any.docx',
+            parse_fn(
+                str(SAMPLE_DOCX_PATH or 'any.docx'),
                 'nonexistent_ruleset.yaml'
             )
 
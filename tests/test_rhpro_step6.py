@@ -2,27 +2,13 @@
 Tests pour les améliorations Step 6
 """
 import pytest
-from pathlib import Path
+from _samples import find_sample_docx
 
-from src.rhpro.parse_bilan import parse_bilan_from_paths
 from src.rhpro.inline_extractor import InlineExtractor
-from src.rhpro.mapper import IGNORE_PATTERNS
-import re
+from src.rhpro.mapper import IGNORE_RE
 
 
-PROJECT_ROOT = Path(__file__).parent.parent
-RULESET_PATH = PROJECT_ROOT / 'config' / 'rulesets' / 'rhpro_v1.yaml'
-
-# Chercher automatiquement le premier source.docx
-def _find_sample_docx():
-    """Trouve le premier source.docx dans data/samples/*/"""
-    samples_dir = PROJECT_ROOT / 'data' / 'samples'
-    if not samples_dir.exists():
-        return None
-    source_files = sorted(samples_dir.glob('**/source.docx'))
-    return source_files[0] if source_files else None
-
-SAMPLE_DOCX_PATH = _find_sample_docx()
+SAMPLE_DOCX_PATH = find_sample_docx()
 
 
 class TestIgnoreTitles:
@@ -37,10 +23,7 @@ class TestIgnoreTitles:
         ]
         
         for title in titles_to_ignore:
-            should_ignore = any(
-                re.search(pattern, title, re.IGNORECASE)
-                for pattern in IGNORE_PATTERNS
-            )
+            should_ignore = IGNORE_RE.search(title) is not None
             assert should_ignore, f"'{title}' devrait être ignoré"
     
     def test_valid_titles_not_ignored(self):
@@ -53,17 +36,20 @@ class TestIgnoreTitles:
         ]
         
         for title in valid_titles:
-            should_ignore = any(
-                re.search(pattern, title, re.IGNORECASE)
-                for pattern in IGNORE_PATTERNS
-            )
+            should_ignore = IGNORE_RE.search(title) is not None
             assert not should_ignore, f"'{title}' ne devrait PAS être ignoré"
 
 
+@pytest.fixture(scope="module")
+def extractor():
+    """Extracteur sans état, partagé par les tests du module"""
+    return InlineExtractor()
+
+
 class TestInlineExtractor:
     """Tests pour l'extraction inline de sous-sections"""
     
-    def test_extract_profession_formation(self):
+    def test_extract_profession_formation(self, extractor):
         """Test extraction de profession et formation"""
         content = """Profession
 Le bénéficiaire a travaillé pendant 15 ans en informatique.
@@ -71,7 +57,6 @@ Le bénéficiaire a travaillé pendant 15 ans en informatique.
 Formation
 CFC obtenu en 2005. Formation continue en 2018."""
         
-        extractor = InlineExtractor()
         result = extractor.extract_subsections('profession_formation', content)
         
         assert result is not None
@@ -80,7 +65,7 @@ CFC obtenu en 2005. Formation continue en 2018."""
         assert '15 ans' in result['profession']
         assert 'CFC' in result['formation']
     
-    def test_extract_orientation_formation(self):
+    def test_extract_orientation_formation(self, extractor):
         """Test extraction de orientation et stage"""
         content = """Orientation
 Orientation vers la cybersécurité.
@@ -88,7 +73,6 @@ Orientation vers la cybersécurité.
 Stage
 Stage de 3 mois recommandé."""
         
-        extractor = InlineExtractor()
         result = extractor.extract_subsections('orientation_formation', content)
         
         assert result is not None
@@ -97,7 +81,7 @@ Stage de 3 mois recommandé."""
         assert 'cybersécurité' in result['orientation']
         assert '3 mois' in result['stage']
     
-    def test_extract_competences(self):
+    def test_extract_competences(self, extractor):
         """Test extraction de compétences sociales et professionnelles"""
         content = """Sociales
 Bonnes capacités de communication.
@@ -105,7 +89,6 @@ Bonnes capacités de communication.
 Professionnelles
 Expertise technique en systèmes."""
         
-        extractor = InlineExtractor()
         result = extractor.extract_subsections('competences', content)
         
         assert result is not None
@@ -113,16 +96,13 @@ Expertise technique en systèmes."""
         assert 'professionnelles' in result
 
 
-@pytest.mark.skipif(not SAMPLE_DOCX_PATH.exists(), reason="Sample DOCX not available")
+@pytest.mark.skipif(SAMPLE_DOCX_PATH is None, reason="Sample DOCX not available")
 class TestStep6Improvements:
     """Tests pour les améliorations Step 6 sur le document complet"""
     
-    def test_bilan_not_mapped_to_orientation(self):
+    def test_bilan_not_mapped_to_orientation(self, parsed_bilan):
         """Vérifie que 'BILAN D'ORIENTATION...' n'est plus mappé à orientation_formation"""
-        result = parse_bilan_from_paths(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         report = result['report']
         
@@ -138,12 +118,9 @@ class TestStep6Improvements:
             if 'BILAN' in title.upper() and 'ORIENTATION' in title.upper():
                 pytest.fail(f"Le titre '{title}' ne devrait pas être mappé")
     
-    def test_profession_formation_as_object(self):
+    def test_profession_formation_as_object(self, parsed_bilan):
         """Vérifie que profession_formation est un objet avec sous-sections"""
-        result = parse_bilan_from_paths(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         normalized = result['normalized']
         profession_formation = normalized['profession_formation']
@@ -162,12 +139,9 @@ class TestStep6Improvements:
         assert profession_formation['formation'], \
             "formation devrait être remplie"
     
-    def test_orientation_formation_as_object(self):
+    def test_orientation_formation_as_object(self, parsed_bilan):
         """Vérifie que orientation_formation est un objet avec sous-sections"""
-        result = parse_bilan_from_paths(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         normalized = result['normalized']
         orientation_formation = normalized['orientation_formation']
@@ -182,12 +156,9 @@ class TestStep6Improvements:
         # Au moins orientation devrait être remplie
         assert orientation_formation['orientation']
     
-    def test_competences_as_object(self):
+    def test_competences_as_object(self, parsed_bilan):
         """Vérifie que competences est un objet avec sous-sections"""
-        result = parse_bilan_from_paths(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         normalized = result['normalized']
         competences = normalized['competences']
@@ -196,12 +167,9 @@ class TestStep6Improvements:
         assert 'sociales' in competences
         assert 'professionnelles' in competences
     
-    def test_missing_required_sections_empty(self):
+    def test_missing_required_sections_empty(self, parsed_bilan):
         """Vérifie qu'il n'y a plus de sections requises manquantes"""
-        result = parse_bilan_from_paths(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         report = result['report']
         
@@ -209,12 +177,9 @@ class TestStep6Improvements:
         assert len(report['missing_required_sections']) == 0, \
             f"Sections manquantes: {report['missing_required_sections']}"
     
-    def test_required_coverage_ratio_100(self):
+    def test_required_coverage_ratio_100(self, parsed_bilan):
         """Vérifie que le required_coverage_ratio est à 100%"""
-        result = parse_bilan_from_paths(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         report = result['report']
         
@@ -222,12 +187,9 @@ class TestStep6Improvements:
         assert report['required_coverage_ratio'] == 1.0, \
             f"Required coverage devrait être 1.0, got {report['required_coverage_ratio']}"
     
-    def test_weighted_coverage_better_than_global(self):
+    def test_weighted_coverage_better_than_global(self, parsed_bilan):
         """Vérifie que weighted_coverage est meilleur que coverage_ratio"""
-        result = parse_bilan_from_paths(
-            str(SAMPLE_DOCX_PATH),
-            str(RULESET_PATH)
-        )
+        result = parsed_bilan
         
         report = result['report']
         
@@ -1,69 +1,80 @@
 """Tests simples pour maximiser la couverture de base."""
 
+import copy
+import io
+
 import pytest
 from pathlib import Path
 from core.render import find_paragraph, delete_paragraph, _style_ok
-from core.context import path_allowed
+from core.context import make_chunks, path_allowed
 from docx import Document
 
 
+def _reload(doc):
+    """Aller-retour save/load en mémoire, sans fichier temporaire."""
+    buf = io.BytesIO()
+    doc.save(buf)
+    buf.seek(0)
+    return Document(buf)
+
+
+@pytest.fixture(scope="class")
+def make_doc(_blank_document):
+    """Fabrique de documents relus depuis la mémoire, partagée par la classe."""
+
+    def _make(paragraphs):
+        doc = copy.deepcopy(_blank_document)
+        for text in paragraphs:
+            doc.add_paragraph(text)
+        return _reload(doc)
+
+    return _make
+
+
 class TestRenderBasics:
     """Tests de base pour render.py."""
 
-    def test_find_paragraph_finds_match(self, tmp_path):
-        """find_paragraph trouve un paragraphe."""
-        doc_path = tmp_path / "find.docx"
-        doc = Document()
-        doc.add_paragraph("Premier")
-        doc.add_paragraph("Deuxième")
-        doc.add_paragraph("Troisième")
-        doc.save(doc_path)
-        
-        doc = Document(doc_path)
-        idx, para = find_paragraph(doc, "Deuxième")
-        
-        assert idx is not None
-        assert para is not None
-        assert "Deuxième" in para.text
-
-    def test_find_paragraph_not_found(self, tmp_path):
-        """find_paragraph ne trouve pas."""
-        doc_path = tmp_path / "notfound.docx"
-        doc = Document()
-        doc.add_paragraph("Texte")
-        doc.save(doc_path)
-        
-        doc = Document(doc_path)
-        idx, para = find_paragraph(doc, "Inexistant")
-        
-        assert idx is None
-        assert para is None
+    @pytest.mark.parametrize(
+        "paragraphs,needle,expected_idx",
+        [
+            (("Premier", "Deuxième", "Troisième"), "Deuxième", 1),
+            (("Texte",), "Inexistant", None),
+        ],
+        ids=["trouve", "absent"],
+    )
+    def test_find_paragraph(self, make_doc, paragraphs, needle, expected_idx):
+        """find_paragraph trouve (ou non) un paragraphe."""
+        doc = make_doc(paragraphs)
+        idx, para = find_paragraph(doc, needle)
 
-    def test_find_paragraph_with_after(self, tmp_path):
+        assert idx == expected_idx
+        if expected_idx is None:
+            assert para is None
+        else:
+            assert needle in para.text
+
+    def test_find_paragraph_with_after(self, make_doc):
         """find_paragraph avec offset after."""
-        doc_path = tmp_path / "after.docx"
-        doc = Document()
-        doc.add_paragraph("A")
-        doc.add_paragraph("B")
-        doc.add_paragraph("A")  # Répétition
-        doc.save(doc_path)
-        
-        doc = Document(doc_path)
+        doc = make_doc(("A", "B", "A"))  # Répétition
         # Trouver après le premier
         idx, para = find_paragraph(doc, "A", after=1)
         
         assert idx == 2  # Le troisième paragraphe (index 2)
 
-    def test_delete_paragraph_removes_it(self, tmp_path):
+    def test_find_paragraph_skips_wrong_style(self, fresh_doc):
+        """Un texte identique hors style attendu (ou en TOC) est ignoré."""
+        fresh_doc.add_paragraph("Conclusion")
+        fresh_doc.add_paragraph("Conclusion", style="TOC Heading")
+        fresh_doc.add_paragraph("Conclusion :", style="Heading 1")
+
+        idx, para = find_paragraph(fresh_doc, "conclusion", style_prefixes=["Heading"])
+
+        assert idx == 2
+        assert para.style.name == "Heading 1"
+
+    def test_delete_paragraph_removes_it(self, make_doc):
         """delete_paragraph supprime."""
-        doc_path = tmp_path / "delete.docx"
-        doc = Document()
-        doc.add_paragraph("Keep")
-        doc.add_paragraph("Delete me")
-        doc.add_paragraph("Keep too")
-        doc.save(doc_path)
-        
-        doc = Document(doc_path)
+        doc = make_doc(("Keep", "Delete me", "Keep too"))
         initial_count = len(doc.paragraphs)
         para_to_delete = doc.paragraphs[1]
         
@@ -74,38 +85,43 @@ class TestRenderBasics:
         assert len(doc.paragraphs) <= initial_count
 
 
+PATH_ALLOWED_CASES = [
+    # (path, include, exclude, attendu)
+    ("docs/file.pdf", ["docs/"], None, True),
+    ("src/main.py", ["src/"], None, True),
+    ("temp/file.txt", None, ["temp/"], False),
+    (".git/config", None, [".git/"], False),
+    ("any/path.txt", ["any/"], None, True),
+    ("docs/file.pdf", ["docs/"], ["docs/temp/"], True),
+    ("docs/temp/file.pdf", ["docs/"], ["docs/temp/"], False),
+    ("anything.txt", None, None, True),
+    ("/deep/nested/path/file.md", None, None, True),
+    ("docs/file.pdf", ["docs/", "src/"], None, True),
+    ("src/main.py", ["docs/", "src/"], None, True),
+    ("temp/file.txt", None, ["temp/", "cache/"], False),
+    ("cache/data.bin", None, ["temp/", "cache/"], False),
+    ("Docs/File.PDF", ["DOCS/"], None, True),  # insensible à la casse
+    ("docs/file.pdf", [""], None, False),  # include sans motif utile: rien ne passe
+    ("docs/file.pdf", None, [""], True),  # exclude vide ignoré
+]
+
+
 class TestPathAllowedCases:
     """Tests pour path_allowed."""
 
-    def test_include_pattern_matches(self):
-        """Include pattern matche."""
-        assert path_allowed("docs/file.pdf", include=["docs/"], exclude=None)
-        assert path_allowed("src/main.py", include=["src/"], exclude=None)
-
-    def test_exclude_pattern_rejects(self):
-        """Exclude pattern rejette."""
-        assert not path_allowed("temp/file.txt", include=None, exclude=["temp/"])
-        assert not path_allowed(".git/config", include=None, exclude=[".git/"])
-
-    def test_include_overrides_nothing(self):
-        """Include fonctionne sans exclude."""
-        assert path_allowed("any/path.txt", include=["any/"], exclude=None)
-
-    def test_both_include_and_exclude(self):
-        """Include et exclude ensemble."""
-        # Inclus dans docs/, mais pas dans docs/temp/
-        assert path_allowed("docs/file.pdf", include=["docs/"], exclude=["docs/temp/"])
-        assert not path_allowed("docs/temp/file.pdf", include=["docs/"], exclude=["docs/temp/"])
-
-    def test_no_filters_allows_all(self):
-        """Sans filtres, tout passe."""
-        assert path_allowed("anything.txt", include=None, exclude=None)
-        assert path_allowed("/deep/nested/path/file.md", include=None, exclude=None)
-
-    def test_multiple_patterns(self):
-        """Plusieurs patterns."""
-        assert path_allowed("docs/file.pdf", include=["docs/", "src/"], exclude=None)
-        assert path_allowed("src/main.py", include=["docs/", "src/"], exclude=None)
-        
-        assert not path_allowed("temp/file.txt", include=None, exclude=["temp/", "cache/"])
-        assert not path_allowed("cache/data.bin", include=None, exclude=["temp/", "cache/"])
+    @pytest.mark.parametrize("path,include,exclude,expected", PATH_ALLOWED_CASES)
+    def test_path_allowed(self, path, include, exclude, expected):
+        """Include/exclude par sous-chaîne, insensibles à la casse."""
+        assert path_allowed(path, include=include, exclude=exclude) is expected
+
+    def test_make_chunks_applies_filters(self):
+        """make_chunks filtre les documents avec les mêmes règles."""
+        payload = {
+            "documents": [
+                {"path": "Docs/a.txt", "ext": ".txt", "text": "alpha"},
+                {"path": "docs/TEMP/b.txt", "ext": ".txt", "text": "beta"},
+                {"path": "src/c.txt", "ext": ".txt", "text": "gamma"},
+            ]
+        }
+        chunks = make_chunks(payload, include=["docs/"], exclude=["temp/"])
+        assert [c.source_path for c in chunks] == ["Docs/a.txt"]
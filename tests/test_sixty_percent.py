@@ -8,55 +8,55 @@ from core.generate import sanitize_output, truncate_chars, truncate_lines
 from core.render import _norm, _stringify_answer, build_moustache_mapping
 
 
+MILLE_LIGNES = "\n".join(f"L{i}" for i in range(1000))
+GRAND_X = "x" * 10000
+ANIMAUX = "le chat et le chien sont dans la maison avec le chat"
+
+
 class TestForSixtyPercent:
     """Tests ciblés pour dépasser 60%."""
 
-    def test_tokenize_comprehensive(self):
-        """Tokenize - cas massifs."""
-        # Avec stop words
-        text1 = "le chat et le chien sont dans la maison avec le chat"
-        result1 = tokenize(text1, remove_stop=True)
-        assert "chat" in result1
-        assert "chien" in result1
-        assert "maison" in result1
-        # Stop words supprimés
-        assert "le" not in result1
-        assert "et" not in result1
-        assert "dans" not in result1
-        
-        # Sans stop words
-        result2 = tokenize(text1, remove_stop=False)
-        assert len(result2) > len(result1)
-        
-        # Cas limites
-        assert tokenize("", remove_stop=True) == []
-        assert tokenize("   ", remove_stop=True) == []
-        
-        # Chiffres et lettres mélangés
-        result3 = tokenize("abc123 def456 ghi789", remove_stop=False)
-        assert len(result3) > 0
-
-    def test_chunk_text_various_scenarios(self):
-        """chunk_text - scénarios variés."""
-        # Texte exactement chunk_size
-        text1 = "a" * 1200
-        result1 = chunk_text(text1, chunk_size=1200, overlap=200)
-        assert len(result1) >= 1
-        
-        # Texte légèrement plus grand
-        text2 = "b" * 1300
-        result2 = chunk_text(text2, chunk_size=1200, overlap=100)
-        assert len(result2) >= 2
-        
-        # Overlap = 0
-        text3 = "mot " * 1000
-        result3 = chunk_text(text3, chunk_size=500, overlap=0)
-        assert len(result3) > 0
-        
-        # Très long texte
-        text4 = "long " * 5000
-        result4 = chunk_text(text4, chunk_size=1000, overlap=50)
-        assert len(result4) > 10
+    @pytest.mark.parametrize(
+        "text,remove_stop,present,absent",
+        [
+            (ANIMAUX, True, {"chat", "chien", "maison"}, {"le", "et", "dans"}),
+            ("", True, set(), set()),
+            ("   ", True, set(), set()),
+            ("abc123 def456 ghi789", False, {"abc123"}, set()),
+        ],
+        ids=["stop_words", "vide", "espaces", "alphanumerique"],
+    )
+    def test_tokenize(self, text, remove_stop, present, absent):
+        """Tokenize - un cas par paramètre."""
+        result = tokenize(text, remove_stop=remove_stop)
+        if not present:
+            assert result == []
+        assert present <= set(result)
+        assert not absent & set(result)
+
+    def test_tokenize_exact_output(self):
+        """Tokens en minuscules, accents et apostrophes conservés, stop words et lettres seules retirés."""
+        text = "Le CFC d'Été à Genève en 2024 : a b"
+        assert tokenize(text) == ["cfc", "d'été", "genève", "2024"]
+        assert tokenize(text, remove_stop=False) == ["le", "cfc", "d'été", "à", "genève", "en", "2024", "a", "b"]
+
+    def test_tokenize_keeps_stop_words_when_asked(self):
+        """Sans filtrage, les stop words sont conservés."""
+        assert len(tokenize(ANIMAUX, remove_stop=False)) > len(tokenize(ANIMAUX, remove_stop=True))
+
+    @pytest.mark.parametrize(
+        "text,chunk_size,overlap,min_chunks",
+        [
+            ("a" * 1200, 1200, 200, 1),   # exactement chunk_size
+            ("b" * 1300, 1200, 100, 2),   # légèrement plus grand
+            ("mot " * 1000, 500, 0, 1),   # overlap = 0
+            ("long " * 5000, 1000, 50, 11),  # très long texte
+        ],
+        ids=["exact", "depassement", "sans_overlap", "tres_long"],
+    )
+    def test_chunk_text(self, text, chunk_size, overlap, min_chunks):
+        """chunk_text - un scénario par paramètre."""
+        assert len(chunk_text(text, chunk_size=chunk_size, overlap=overlap)) >= min_chunks
 
     def test_normalize_variations(self):
         """normalize_text - variations."""
@@ -78,6 +78,13 @@ class TestForSixtyPercent:
         result = normalize_text("a\n\n\n\n\n\n\nb")
         assert "\n\n\n\n" not in result
 
+    @pytest.mark.parametrize("normalize", [normalize_text, extract_normalize], ids=["context", "extract"])
+    def test_normalize_exact_output(self, normalize):
+        """normalize_text - \\r\\n compte pour un seul saut de ligne."""
+        assert normalize("a\r\nb\rc") == "a\nb\nc"
+        assert normalize("a\r\n\r\n\r\nb") == "a\n\nb"
+        assert normalize("  a\n\n\n\nb  ") == "a\n\nb"
+
     def test_sha256_variations(self):
         """SHA256 - variations."""
         # Vide
@@ -100,35 +107,42 @@ class TestForSixtyPercent:
         # Même texte = même hash
         assert sha256_text("test") == sha256_text("test")
 
-    def test_sanitize_all_patterns(self):
-        """sanitize_output - tous patterns."""
-        # Backticks multiples
-        assert "```" not in sanitize_output("```python\ncode\n```")
-        
-        # Zero-width space
-        result = sanitize_output("text\u200bwith\u200bspaces")
-        assert "\u200b" not in result
-        
-        # JSON prefix variations
-        assert sanitize_output("JSON: data") == "data"
-        assert sanitize_output("json:data") == "data"
-        assert sanitize_output("Json: stuff") == "stuff"
-        
-        # Whitespace
-        assert sanitize_output("  data  ") == "data"
+    @pytest.mark.parametrize(
+        "raw,forbidden",
+        [
+            ("```python\ncode\n```", "```"),
+            ("text\u200bwith\u200bspaces", "\u200b"),
+        ],
+        ids=["backticks", "zero_width"],
+    )
+    def test_sanitize_strips(self, raw, forbidden):
+        """sanitize_output - retire les artefacts."""
+        assert forbidden not in sanitize_output(raw)
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("JSON: data", "data"),
+            ("json:data", "data"),
+            ("Json: stuff", "stuff"),
+            ("  data  ", "data"),
+        ],
+    )
+    def test_sanitize_prefix_and_whitespace(self, raw, expected):
+        """sanitize_output - préfixe JSON et espaces."""
+        assert sanitize_output(raw) == expected
 
     def test_truncate_comprehensive(self):
         """Truncation complète."""
         # Lines - beaucoup de lignes
-        lines = "\n".join([f"L{i}" for i in range(1000)])
-        result = truncate_lines(lines, 50)
+        result = truncate_lines(MILLE_LIGNES, 50)
         assert result.count("\n") <= 50
         
         # Lines - avec lignes vides
         text = "a\n\n\nb\n\n\nc"
         result = truncate_lines(text, 2)
         # Devrait ignorer les vides
-        assert "a" in result
+        assert result == "a\nb"
         
         # Chars - exactement à la limite
         assert len(truncate_chars("a" * 100, 100)) <= 105
@@ -137,10 +151,22 @@ class TestForSixtyPercent:
         assert truncate_chars("short", 1000) == "short"
         
         # Chars - très long
-        long_text = "x" * 10000
-        result = truncate_chars(long_text, 500)
+        result = truncate_chars(GRAND_X, 500)
         assert len(result) <= 510
 
+    def test_truncate_lines_without_limit(self):
+        """truncate_lines - une limite nulle ne coupe rien."""
+        assert truncate_lines(" a \n\n b ", 0) == "a\nb"
+
+    def test_truncate_lines_negative_limit_drops_last_lines(self):
+        """truncate_lines - une limite négative retire les dernières lignes non vides (comme un slice)."""
+        assert truncate_lines(" a \n\n b \n c", -1) == "a\nb"
+        assert truncate_lines("a\nb", -5) == ""
+
+    def test_truncate_lines_stops_at_limit(self):
+        """truncate_lines - garde exactement les N premières lignes non vides."""
+        assert truncate_lines(MILLE_LIGNES, 3) == "L0\nL1\nL2"
+
     def test_norm_all_cases(self):
         """_norm - tous les cas."""
         assert _norm("UPPER") == "upper"
@@ -1,67 +1,133 @@
 """Tests pour le module core/template_fields.py."""
 
+import copy
+import io
+
 import pytest
 from pathlib import Path
 from core.template_fields import extract_placeholders_from_docx
-from docx import Document
+
+
+def _as_stream(doc) -> io.BytesIO:
+    """Sérialise le document en mémoire (pas d'aller-retour disque)."""
+    buf = io.BytesIO()
+    doc.save(buf)
+    buf.seek(0)
+    return buf
+
+
+def _paragraphs(*texts):
+    def build(doc):
+        for text in texts:
+            doc.add_paragraph(text)
+    return build
+
+
+def _single_cell(text):
+    def build(doc):
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = text
+    return build
+
+
+# Templates figés des tests de base: nom -> construction du contenu
+FIXED_TEMPLATES = {
+    "simple": _paragraphs("Bonjour {{NOM}}"),
+    "multiple": _paragraphs("{{NOM}} {{PRÉNOM}} habite à {{VILLE}}"),
+    "duplicates": _paragraphs("{{NOM}} est {{NOM}}"),
+    "empty": _paragraphs(),
+    "table": _single_cell("{{TABLEAU}}"),
+}
+
+
+@pytest.fixture(scope="session")
+def fixed_templates(_blank_document):
+    """DOCX sérialisés une seule fois par session, relus via BytesIO par chaque test."""
+    templates = {}
+    for name, build in FIXED_TEMPLATES.items():
+        doc = copy.deepcopy(_blank_document)
+        build(doc)
+        templates[name] = _as_stream(doc).getvalue()
+    return templates
+
+
+@pytest.fixture
+def extract_fixed(fixed_templates):
+    def _extract(name):
+        return extract_placeholders_from_docx(io.BytesIO(fixed_templates[name]))
+    return _extract
 
 
 class TestExtractPlaceholders:
     """Tests pour l'extraction des placeholders."""
 
-    def test_extracts_simple_placeholder(self, tmp_path):
+    def test_extracts_simple_placeholder(self, extract_fixed):
         """Extrait un placeholder simple."""
-        template_path = tmp_path / "template.docx"
-        
-        doc = Document()
-        doc.add_paragraph("Bonjour {{NOM}}")
-        doc.save(template_path)
-        
-        result = extract_placeholders_from_docx(template_path)
+        result = extract_fixed("simple")
         assert "NOM" in result
 
-    def test_extracts_multiple_placeholders(self, tmp_path):
+    def test_extracts_multiple_placeholders(self, extract_fixed):
         """Extrait plusieurs placeholders."""
-        template_path = tmp_path / "template.docx"
-        
-        doc = Document()
-        doc.add_paragraph("{{NOM}} {{PRÉNOM}} habite à {{VILLE}}")
-        doc.save(template_path)
-        
-        result = extract_placeholders_from_docx(template_path)
+        result = extract_fixed("multiple")
         assert "NOM" in result
         assert "PRÉNOM" in result
         assert "VILLE" in result
 
-    def test_removes_duplicates(self, tmp_path):
+    def test_removes_duplicates(self, extract_fixed):
         """Supprime les doublons."""
-        template_path = tmp_path / "template.docx"
-        
-        doc = Document()
-        doc.add_paragraph("{{NOM}} est {{NOM}}")
-        doc.save(template_path)
-        
-        result = extract_placeholders_from_docx(template_path)
+        result = extract_fixed("duplicates")
         assert result.count("NOM") == 1
 
-    def test_handles_empty_document(self, tmp_path):
+    def test_handles_empty_document(self, extract_fixed):
         """Gère un document vide."""
-        template_path = tmp_path / "template.docx"
-        
-        doc = Document()
-        doc.save(template_path)
-        
-        result = extract_placeholders_from_docx(template_path)
+        result = extract_fixed("empty")
         assert result == []
 
-    def test_extracts_from_tables(self, tmp_path):
+    def test_extracts_from_tables(self, extract_fixed):
         """Extrait depuis les tableaux."""
+        result = extract_fixed("table")
+        assert "TABLEAU" in result
+
+    def test_accepts_path(self, fresh_doc, tmp_path):
+        """Accepte toujours un chemin sur disque."""
         template_path = tmp_path / "template.docx"
-        
-        doc = Document()
-        table = doc.add_table(rows=1, cols=1)
-        table.cell(0, 0).text = "{{TABLEAU}}"
+
+        doc = fresh_doc
+        doc.add_paragraph("{{CHEMIN}}")
         doc.save(template_path)
-        
-        result = extract_placeholders_from_docx(template_path)
-        assert "TABLEAU" in result
+
+        assert extract_placeholders_from_docx(template_path) == ["CHEMIN"]
+        assert extract_placeholders_from_docx(str(template_path)) == ["CHEMIN"]
+
+    def test_keeps_first_occurrence_order(self, fresh_doc):
+        """Conserve l'ordre de première apparition, espaces internes retirés."""
+        doc = fresh_doc
+        doc.add_paragraph("{{B}} {{ A }}")
+        doc.add_paragraph("{{A}} {{C}} {{B}}")
+
+        assert extract_placeholders_from_docx(_as_stream(doc)) == ["B", "A", "C"]
+
+    def test_joins_runs_split_placeholder(self, fresh_doc):
+        """Détecte un placeholder découpé sur plusieurs runs."""
+        doc = fresh_doc
+        paragraph = doc.add_paragraph()
+        for part in ("Bonjour {{", "NOM", "}} !"):
+            paragraph.add_run(part)
+
+        assert extract_placeholders_from_docx(_as_stream(doc)) == ["NOM"]
+
+    def test_does_not_join_across_paragraphs(self, fresh_doc):
+        """Deux paragraphes ne forment jamais un placeholder à eux deux."""
+        doc = fresh_doc
+        doc.add_paragraph("début {{")
+        doc.add_paragraph("FAUX}} fin")
+
+        assert extract_placeholders_from_docx(_as_stream(doc)) == []
+
+    def test_extracts_from_nested_tables(self, fresh_doc):
+        """Extrait depuis un tableau imbriqué dans une cellule."""
+        doc = fresh_doc
+        outer = doc.add_table(rows=1, cols=1)
+        inner = outer.cell(0, 0).add_table(rows=1, cols=1)
+        inner.cell(0, 0).text = "{{IMBRIQUE}}"
+
+        assert extract_placeholders_from_docx(_as_stream(doc)) == ["IMBRIQUE"]
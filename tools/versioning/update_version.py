@@ -12,8 +12,10 @@ VERSION_FILE = ROOT / "VERSION"
 
 
 def _run_git(*args: str) -> str:
+    # Lecture seule: --no-optional-locks évite de prendre index.lock (conflit avec un
+    # git lancé en parallèle par l'IDE ou un hook)
     return (
-        subprocess.check_output(["git", *args], cwd=ROOT, text=True)
+        subprocess.check_output(["git", "--no-optional-locks", *args], cwd=ROOT, text=True)
         .strip()
         .replace("\n", "")
     )
@@ -34,7 +36,16 @@ def compute_version() -> str:
 
 def main() -> None:
     version = compute_version()
-    VERSION_FILE.write_text(version + "\n", encoding="utf-8")
+    content = version + "\n"
+    try:
+        unchanged = VERSION_FILE.read_text(encoding="utf-8") == content
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged:
+        # Pas de réécriture: le mtime de VERSION ne bouge que si la version change
+        print(f"VERSION inchangée -> {version}")
+        return
+    VERSION_FILE.write_text(content, encoding="utf-8")
     print(f"VERSION mise à jour -> {version}")
 
 